@@ -0,0 +1,273 @@
+import hashlib
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import constants
+
+# The 8 symmetries of the square grid (rotations + reflections) as matrices (a, b, c, d):
+# (x, y) -> (a*x + b*y, c*x + d*y). All are orthogonal, so the inverse is the transpose.
+_SYMMETRIES = [
+    (1, 0, 0, 1),
+    (0, 1, -1, 0),
+    (-1, 0, 0, -1),
+    (0, -1, 1, 0),
+    (-1, 0, 0, 1),
+    (0, 1, 1, 0),
+    (1, 0, 0, -1),
+    (0, -1, -1, 0),
+]
+
+
+def apply_symmetry(symmetry, x, y):
+    a, b, c, d = _SYMMETRIES[symmetry]
+    return (a * x + b * y, c * x + d * y)
+
+
+def invert_symmetry(symmetry, x, y):
+    a, b, c, d = _SYMMETRIES[symmetry]
+    return (a * x + c * y, b * x + d * y) # Transpose
+
+
+def rotate_vector(x, y, degrees):
+    """Rotates a displacement the same way Game._rotate_point rotates pattern cells (clockwise)."""
+    if degrees == 90:
+        return (y, -x)
+    if degrees == 180:
+        return (-x, -y)
+    if degrees == 270:
+        return (-y, x)
+    return (x, y)
+
+
+def _speed_notation(distance, period):
+    """Life speed notation for `distance` cells per `period` generations, e.g. 'c/4' or '2c/5'."""
+    divisor = math.gcd(distance, period)
+    distance, period = distance // divisor, period // divisor
+    if period == 1:
+        return f"{distance}c" if distance > 1 else "c"
+    if distance == 1:
+        return f"c/{period}"
+    return f"{distance}c/{period}"
+
+
+def normalize(cells):
+    """Translates a set of (x, y) cells so its bounding box starts at (0, 0).
+       Returns (shape, (offset_x, offset_y)) where shape is a sorted tuple of cells.
+    """
+    if not cells:
+        return (), (0, 0)
+    min_x = min(x for x, _ in cells)
+    min_y = min(y for _, y in cells)
+    shape = tuple(sorted((x - min_x, y - min_y) for x, y in cells))
+    return shape, (min_x, min_y)
+
+
+def canonical_form(cells):
+    """Returns (shape, symmetry): the normalized shape shared by all rotations/reflections of
+       the cells, and the index of the symmetry that maps these cells onto it.
+    """
+    return min((normalize([apply_symmetry(symmetry, x, y) for x, y in cells])[0], symmetry)
+               for symmetry in range(len(_SYMMETRIES)))
+
+
+def canonical_shape(cells):
+    return canonical_form(cells)[0]
+
+
+def _shape_hash(shape):
+    return hashlib.sha1(repr(shape).encode("ascii")).hexdigest()
+
+
+def canonical_hash(cells):
+    """Stable hash of a pattern, identical for any translation, rotation or reflection."""
+    return _shape_hash(canonical_shape(cells))
+
+
+def step_unbounded(live_cells):
+    """Runs one Conway generation on an infinite, barrier-free plane (the sandbox)."""
+    neighbor_counts = {}
+    for x, y in live_cells:
+        for i in range(-1, 2):
+            for j in range(-1, 2):
+                if i == 0 and j == 0:
+                    continue
+                key = (x + i, y + j)
+                neighbor_counts[key] = neighbor_counts.get(key, 0) + 1
+    return {cell for cell, count in neighbor_counts.items()
+            if count == 3 or (count == 2 and cell in live_cells)}
+
+
+class PatternAnalysis:
+    """Classification of a pattern's free evolution in the sandbox.
+       dx/dy are per-period displacement in the orientation the pattern was analyzed in
+       (the canonical one, for catalog entries); see displacement() for other orientations.
+    """
+
+    def __init__(self, kind, period=None, dx=0, dy=0, settle_generation=0, generations_run=0):
+        self.kind = kind # still_life, oscillator, spaceship, dies, unknown
+        self.period = period
+        self.dx = dx
+        self.dy = dy
+        self.settle_generation = settle_generation # Generation at which the cycle starts
+        self.generations_run = generations_run
+
+    def speed(self):
+        """Speed as Life notation, e.g. 'c/4' or '2c/5'. None if not moving."""
+        distance = max(abs(self.dx), abs(self.dy))
+        if not self.period or distance == 0:
+            return None
+        return _speed_notation(distance, self.period)
+
+    def displacement(self, symmetry=0, rotation=0):
+        """Displacement per period for a saved pattern whose canonical symmetry is `symmetry`,
+           after the player rotates it by `rotation` degrees.
+        """
+        dx, dy = invert_symmetry(symmetry, self.dx, self.dy)
+        return rotate_vector(dx, dy, rotation)
+
+    def goal_motion(self, symmetry=0, rotation=0):
+        """How a spaceship moves relative to the goal column (+x), e.g. 'c/4 toward goal'."""
+        if self.kind != "spaceship":
+            return None
+        dx, _ = self.displacement(symmetry, rotation)
+        if dx > 0:
+            return f"{_speed_notation(dx, self.period)} toward goal"
+        if dx < 0:
+            return "moves away from goal"
+        return "moves parallel to goal"
+
+    def direction(self):
+        if self.dx == 0 or self.dy == 0:
+            return "orthogonal"
+        if abs(self.dx) == abs(self.dy):
+            return "diagonal"
+        return "oblique"
+
+    def title(self):
+        if self.kind == "still_life":
+            return "Still life"
+        if self.kind == "oscillator":
+            return "Oscillator"
+        if self.kind == "spaceship":
+            return f"{self.speed()} {self.direction()} spaceship"
+        if self.kind == "dies":
+            return f"Dies out at gen {self.generations_run}"
+        return f"Unclassified after {self.generations_run} gens"
+
+    def detail(self):
+        if self.kind in ("dies", "unknown"):
+            return ""
+        parts = [f"period {self.period}"]
+        if self.settle_generation:
+            parts.append(f"settles at gen {self.settle_generation}")
+        return ", ".join(parts)
+
+    def short_label(self, symmetry=0, rotation=0):
+        """Few-word label for the saved-pattern buttons, e.g. 'c/4 toward goal' or 'Oscillator p2'."""
+        if self.kind == "spaceship":
+            return self.goal_motion(symmetry, rotation)
+        if self.kind == "oscillator":
+            return f"Oscillator p{self.period}"
+        if self.kind == "dies":
+            return "Dies out"
+        if self.kind == "unknown":
+            return "Unclassified"
+        return self.title()
+
+    def describe(self, symmetry=0, rotation=0):
+        """One-line summary, e.g. 'c/4 diagonal spaceship, period 4, c/4 toward goal'."""
+        detail = self.detail()
+        if self.kind == "still_life" and not self.settle_generation:
+            return self.title() # Period 1 is implied
+        summary = f"{self.title()}, {detail}" if detail else self.title()
+        motion = self.goal_motion(symmetry, rotation)
+        return f"{summary}, {motion}" if motion else summary
+
+
+def analyze_pattern(pattern, max_generations=constants.ANALYSIS_MAX_GENERATIONS,
+                    max_population=constants.ANALYSIS_MAX_POPULATION):
+    """Runs a pattern (list of relative (dx, dy) coords) in an unbounded sandbox and
+       detects period and displacement by hashing the normalized shape of each generation.
+    """
+    live = set(pattern)
+    seen = {} # normalized shape -> (generation, offset)
+    for generation in range(max_generations + 1):
+        if not live:
+            return PatternAnalysis("dies", generations_run=generation)
+        shape, offset = normalize(live)
+        if shape in seen:
+            first_generation, first_offset = seen[shape]
+            period = generation - first_generation
+            dx = offset[0] - first_offset[0]
+            dy = offset[1] - first_offset[1]
+            if dx or dy:
+                kind = "spaceship"
+            elif period == 1:
+                kind = "still_life"
+            else:
+                kind = "oscillator"
+            return PatternAnalysis(kind, period, dx, dy, first_generation, generation)
+        seen[shape] = (generation, offset)
+        if len(live) > max_population:
+            break # Growing without bound (gun, puffer, ...) - stop early
+        live = step_unbounded(live)
+    return PatternAnalysis("unknown", generations_run=generation)
+
+
+class PatternCatalog:
+    """Cache of pattern analyses keyed by canonical pattern hash.
+       Analysis runs on a background worker so large craft boxes never stall a frame.
+    """
+
+    def __init__(self):
+        self._results = {} # canonical hash -> PatternAnalysis
+        self._pending = {} # canonical hash -> Future
+        self._lock = threading.Lock()
+        self.version = 0 # Bumped on every finished analysis so the UI knows to redraw
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="pattern-analysis")
+
+    def request(self, pattern):
+        """Queues analysis of a pattern unless it (or a rotation/reflection) is already known.
+           Returns (key, symmetry); pass the symmetry to PatternAnalysis.describe() so the
+           canonical displacement is mapped back onto this pattern's orientation.
+        """
+        if not pattern:
+            return None, 0
+        shape, symmetry = canonical_form(pattern)
+        key = _shape_hash(shape)
+        with self._lock:
+            if key not in self._results and key not in self._pending:
+                # Always analyze the canonical orientation, so dx/dy don't depend on who saved first
+                self._pending[key] = self._executor.submit(self._analyze, key, list(shape))
+        return key, symmetry
+
+    def _analyze(self, key, pattern):
+        result = PatternAnalysis("unknown") # Kept if the analysis fails, so the UI stops waiting
+        try:
+            result = analyze_pattern(pattern)
+        except Exception as e:
+            print(f"Pattern analysis failed: {e}")
+        finally:
+            with self._lock:
+                self._results[key] = result
+                self._pending.pop(key, None)
+                self.version += 1
+        return result
+
+    def get(self, key):
+        """Returns the cached PatternAnalysis for a canonical hash, or None if not analyzed (yet)."""
+        with self._lock:
+            return self._results.get(key)
+
+    def is_pending(self, key):
+        with self._lock:
+            return key in self._pending
+
+    def lookup(self, pattern):
+        """Same as get(), but hashes the pattern first."""
+        if not pattern:
+            return None
+        return self.get(canonical_hash(pattern))
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -1,5 +1,3 @@
-import pygame
-
 # Screen dimensions
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
@@ -15,6 +13,9 @@ GRID_PIXEL_HEIGHT = GRID_HEIGHT * CELL_SIZE
 START_ZONE_WIDTH = 15 # Increased size
 GOAL_COLUMN = GRID_WIDTH - 1 # Last column is the goal
 
+# Grid rendering: "tiles" (Tile.draw per cell) or "pixel_array" (one scaled blit, see pixel_renderer.py)
+GRID_RENDER_MODE = "pixel_array"
+
 # Colors
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -40,4 +41,45 @@ CRAFT_BOX_SIZES = [(5, 5), (10, 10), (10, 20), (25, 25)]
 DEFAULT_CRAFT_BOX_SIZE_INDEX = 1 # Default to 10x10
 CRAFT_GRID_CELL_SIZE = 20 # Larger cells for easier editing
 CRAFT_GRID_BG_COLOR = (30, 30, 30)
-CRAFT_UI_AREA_WIDTH = 200 # Width for buttons next to craft grid 
\ No newline at end of file
+CRAFT_UI_AREA_WIDTH = 200 # Width for buttons next to craft grid 
+# --- Pattern Analysis (Craft Box sandbox) ---
+ANALYSIS_MAX_GENERATIONS = 256 # Generations to run before giving up on classification
+ANALYSIS_MAX_POPULATION = 2000 # Stop early if the pattern grows past this many cells
+
+# --- Simulation Outcomes (batch/ensemble runs) ---
+OUTCOME_WIN = "win"
+OUTCOME_DIED = "died"
+OUTCOME_STALEMATE = "stalemate"
+OUTCOME_MAX_TURNS = "max_turns"
+OUTCOME_UNREACHABLE = "unreachable" # Light-cone bound proves the goal can't be reached in time
+OUTCOME_MESSAGES = {
+    OUTCOME_WIN: "You Win!",
+    OUTCOME_DIED: "Game Over - All Cells Died!",
+    OUTCOME_STALEMATE: "Game Over - Stalemate!",
+    OUTCOME_MAX_TURNS: "Game Over - Max Turns Reached!",
+    OUTCOME_UNREACHABLE: "Game Over - Goal Unreachable!",
+}
+RULES_VERSION = 2 # Bump when outcomes for the same setup can change (invalidates cached outcomes)
+
+# --- Main Loop ---
+SIMULATION_FPS = 100 # Frames (= simulation steps) per second while simulating
+RENDER_ON_DEMAND = True # Outside the simulation, block on input and redraw only on changes
+IDLE_WAIT_TIMEOUT_MS = 250 # Max time to block on input while idle (picks up background results)
+
+# --- Simulation Service (leaderboard validation) ---
+SERVICE_HOST = "127.0.0.1" # Localhost only
+SERVICE_PORT = 8765
+SERVICE_WORKERS = 2 # Simulation worker threads
+SERVICE_MAX_PENDING = 256 # Submissions queued or running before new ones are rejected
+SERVICE_BATCH_SIZE = 64 # Max submissions simulated together in one ensemble pass
+SERVICE_BATCH_WINDOW_MS = 5 # How long the dispatcher waits to fill a batch
+SERVICE_CACHE_SIZE = 4096 # Results kept in the content-addressed cache
+SERVICE_REQUEST_TIMEOUT_S = 30
+SERVICE_MAX_BODY_BYTES = 1024 * 1024 # Larger POST bodies are rejected (413) before reading
+
+# --- Outcome Cache (memoized results for identical setups) ---
+OUTCOME_CACHE_SIZE = 256 # Entries kept in memory (LRU)
+OUTCOME_CACHE_DIR = None # Directory for the on-disk tier, None to disable
+OUTCOME_CACHE_MAX_DISK_BYTES = 64 * 1024 * 1024 # Disk tier evicts least recently used files past this
+OUTCOME_CACHE_STORE_RUNS = True # Record per-turn cell changes so cached runs can be replayed
+OUTCOME_CACHE_REPLAY = True # On a hit, replay the stored run instead of jumping to the result
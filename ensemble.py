@@ -0,0 +1,226 @@
+import numpy as np
+import constants
+from placement import block_budget_error, pattern_placement_error
+from reachability import ReachabilityBound
+
+# Ensemble mode: K board variants stacked along a batch axis (shape K x width x height,
+# indexed [k, x, y] like Grid.tiles) and stepped together with numpy.
+
+
+def barriers_from_grid(grid):
+    """Returns the barrier coordinates of a Grid, for use as the `barriers` argument below."""
+    return [(x, y) for x in range(grid.width) for y in range(grid.height)
+            if grid.tiles[x][y].tile_type == "barrier"]
+
+
+def check_placements(placements, barriers, max_blocks=None,
+                     width=constants.GRID_WIDTH, height=constants.GRID_HEIGHT):
+    """Applies a list of (top_left_x, top_left_y, pattern) placements with the same rules
+       as Grid.place_pattern plus the block budget. Returns (live_cells, None) if valid,
+       or (None, reason) for the first invalid cell.
+    """
+    barrier_set = set(map(tuple, barriers))
+    live = set()
+
+    def tile_state(x, y):
+        return ("barrier" if (x, y) in barrier_set else "empty"), (x, y) in live
+
+    for top_left_x, top_left_y, pattern in placements:
+        error = pattern_placement_error(top_left_x, top_left_y, pattern, tile_state, width, height)
+        if error:
+            return None, error
+        live.update((top_left_x + dx, top_left_y + dy) for dx, dy in pattern)
+    if max_blocks is not None:
+        error = block_budget_error(0, len(live), max_blocks)
+        if error:
+            return None, error
+    return live, None
+
+
+def placement_cells(placements, barriers, max_blocks=None,
+                    width=constants.GRID_WIDTH, height=constants.GRID_HEIGHT):
+    """Same as check_placements, but returns only the live cells (None if invalid)."""
+    return check_placements(placements, barriers, max_blocks, width, height)[0]
+
+
+def generate_variants(placements, barriers, max_blocks=None):
+    """Yields (label, live_cells) for the base setup and its valid single perturbations:
+       one cell removed, one placement shifted by a cell, or the whole setup shifted.
+       Variants without live cells are skipped.
+    """
+    base = placement_cells(placements, barriers, max_blocks)
+    if not base: # Invalid or empty setup: nothing to score
+        return
+    yield "base", base
+
+    shifts = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+    for i, (top_left_x, top_left_y, pattern) in enumerate(placements):
+        others = placements[:i] + placements[i + 1:]
+        # Remove a single cell from this placement
+        for j, cell in enumerate(pattern):
+            reduced = list(pattern[:j]) + list(pattern[j + 1:])
+            variant = others + ([(top_left_x, top_left_y, reduced)] if reduced else [])
+            cells = placement_cells(variant, barriers, max_blocks)
+            if cells:
+                yield f"placement {i}: remove cell {cell}", cells
+        # Shift this placement by one cell
+        if len(placements) > 1:
+            for sx, sy in shifts:
+                variant = others + [(top_left_x + sx, top_left_y + sy, pattern)]
+                cells = placement_cells(variant, barriers, max_blocks)
+                if cells:
+                    yield f"placement {i}: shift ({sx}, {sy})", cells
+
+    # Shift the whole setup (e.g. one row lower)
+    for sx, sy in shifts:
+        variant = [(x + sx, y + sy, pattern) for x, y, pattern in placements]
+        cells = placement_cells(variant, barriers, max_blocks)
+        if cells:
+            yield f"setup: shift ({sx}, {sy})", cells
+
+
+def build_live_masks(cell_sets, width=constants.GRID_WIDTH, height=constants.GRID_HEIGHT):
+    """Stacks sets of live (x, y) cells into a K x width x height bool array."""
+    live_masks = np.zeros((len(cell_sets), width, height), dtype=bool)
+    for k, cells in enumerate(cell_sets):
+        for x, y in cells:
+            live_masks[k, x, y] = True
+    return live_masks
+
+
+def build_barrier_mask(barriers, width=constants.GRID_WIDTH, height=constants.GRID_HEIGHT):
+    barrier_mask = np.zeros((width, height), dtype=bool)
+    for bx, by in barriers:
+        if bx != constants.GOAL_COLUMN: # Grid.set_tile_type never puts barriers on goal tiles
+            barrier_mask[bx, by] = True
+    return barrier_mask
+
+
+def _neighbor_counts(live):
+    """Counts live neighbors for every cell of every board. Cells outside the grid are dead."""
+    batch, width, height = live.shape
+    padded = np.zeros((batch, width + 2, height + 2), dtype=np.uint8)
+    padded[:, 1:-1, 1:-1] = live
+    counts = np.zeros((batch, width, height), dtype=np.uint8)
+    for i in range(3):
+        for j in range(3):
+            if i == 1 and j == 1:
+                continue
+            counts += padded[:, i:i + width, j:j + height]
+    return counts
+
+
+def _dilate(mask):
+    """Grows each board's mask by one cell in all 8 directions."""
+    batch, width, height = mask.shape
+    padded = np.zeros((batch, width + 2, height + 2), dtype=bool)
+    padded[:, 1:-1, 1:-1] = mask
+    grown = np.zeros_like(mask)
+    for i in range(3):
+        for j in range(3):
+            grown |= padded[:, i:i + width, j:j + height]
+    return grown
+
+
+def run_ensemble(live_masks, barrier_mask, max_turns=constants.NUM_TURNS, prune=True):
+    """Steps a batch of boards (bool array K x width x height) with the same rules as
+       Game.update/_step_simulation. Returns (outcomes, turns): one constants.OUTCOME_* and
+       ending turn per board. Finished boards are dropped from the batch.
+       prune=False disables the unreachable-goal cutoff (reference runs for tests).
+    """
+    live = np.array(live_masks, dtype=bool)
+    batch, width, height = live.shape
+    open_mask = ~np.asarray(barrier_mask, dtype=bool)
+    goal_mask = np.zeros((width, height), dtype=bool)
+    goal_mask[constants.GOAL_COLUMN, :] = True
+
+    # Light-cone pruning: best-case turns to the goal for a live cell in each column
+    reachability = ReachabilityBound(np.argwhere(~open_mask).tolist(), width, height)
+    column_min_distance = np.array(reachability.column_min_distance, dtype=float)
+
+    persistent = np.zeros_like(live)
+    active = np.arange(batch) # Original index of each board still in the batch
+    outcomes = [None] * batch
+    turns = [max_turns] * batch
+
+    for turn in range(1, max_turns + 1):
+        if not len(active):
+            break
+        counts = _neighbor_counts(live)
+        next_live = ((counts == 3) | (live & (counts == 2))) & open_mask
+        next_live |= persistent # Persistence overrides death
+
+        # Goal entry marks cells persistent, then spreads through connected live cells
+        frontier = next_live & goal_mask & ~persistent
+        state_changed = (next_live != live).any(axis=(1, 2)) | frontier.any(axis=(1, 2))
+        while frontier.any():
+            persistent |= frontier
+            frontier = _dilate(frontier) & next_live & ~persistent
+        live = next_live
+
+        won = (live & goal_mask).any(axis=(1, 2))
+        died = ~live.any(axis=(1, 2))
+        stalled = ~state_changed
+        occupied = live.any(axis=2)
+        goal_distance = np.where(occupied, column_min_distance, np.inf).min(axis=1)
+        unreachable = (goal_distance > max_turns - turn) & (turn < max_turns) & prune # Last turn ends as max_turns
+
+        finished = won | died | stalled | unreachable
+        for k in np.flatnonzero(finished):
+            index = active[k]
+            turns[index] = turn
+            if won[k]:
+                outcomes[index] = constants.OUTCOME_WIN
+            elif died[k]:
+                outcomes[index] = constants.OUTCOME_DIED
+            elif stalled[k]:
+                outcomes[index] = constants.OUTCOME_STALEMATE
+            else:
+                outcomes[index] = constants.OUTCOME_UNREACHABLE
+        if finished.any():
+            keep = ~finished
+            live, persistent, active = live[keep], persistent[keep], active[keep]
+
+    for index in active:
+        outcomes[index] = constants.OUTCOME_MAX_TURNS # A goal hit would already have finished it
+    return outcomes, turns
+
+
+class EnsembleReport:
+    """Per-variant outcomes of a robustness run. `robustness` is the share of perturbed variants that still win."""
+
+    def __init__(self, labels, outcomes, turns):
+        self.labels = labels
+        self.outcomes = outcomes
+        self.turns = turns
+
+    @property
+    def base_outcome(self):
+        return self.outcomes[0] if self.outcomes else None
+
+    @property
+    def robustness(self):
+        perturbed = self.outcomes[1:]
+        if not perturbed:
+            return 0.0
+        return sum(1 for outcome in perturbed if outcome == constants.OUTCOME_WIN) / len(perturbed)
+
+    def summary(self):
+        counts = {}
+        for outcome in self.outcomes[1:]:
+            counts[outcome] = counts.get(outcome, 0) + 1
+        return counts
+
+
+def score_setup(placements, barriers, max_turns=constants.NUM_TURNS, max_blocks=None,
+                width=constants.GRID_WIDTH, height=constants.GRID_HEIGHT):
+    """Simulates a setup and all its single perturbations in one ensemble.
+       `placements` is a list of (top_left_x, top_left_y, pattern); single cells use pattern [(0, 0)].
+    """
+    variants = list(generate_variants(placements, barriers, max_blocks))
+    if not variants:
+        return EnsembleReport([], [], [])
+
+    live_masks = build_live_masks([cells for _, cells in variants], width, height)
+    outcomes, turns = run_ensemble(live_masks, build_barrier_mask(barriers, width, height), max_turns)
+    return EnsembleReport([label for label, _ in variants], outcomes, turns)
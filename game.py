@@ -1,15 +1,25 @@
 import pygame
 import constants
+import levels
 from grid import Grid
 from crafting import CraftBox # Import CraftBox
+from analysis import PatternCatalog
+from outcome_cache import OutcomeCache, setup_key
+from reachability import ReachabilityBound
+from pixel_renderer import PixelGridRenderer
+from placement import block_budget_error, pattern_placement_error
 import copy
 from collections import deque # Needed for persistence spread (BFS)
 
 class Game:
-    def __init__(self):
+    def __init__(self, level_id=levels.DEFAULT_LEVEL_ID):
+        self.level_id = level_id
+        level = levels.get_level(level_id)
         self.grid = Grid(constants.GRID_WIDTH, constants.GRID_HEIGHT)
         self.craft_box = CraftBox() # Initialize CraftBox
         self.saved_patterns = [] # To store saved patterns
+        self.saved_pattern_keys = [] # (canonical hash, symmetry) per saved pattern, for analysis lookup
+        self.pattern_catalog = PatternCatalog() # Sandbox classifications, shared across resets
         self.mouse_pos = (0, 0) # Store mouse position for drawing pattern preview
         # --- Pattern Selection State ---
         self.selected_pattern_index = None # Index of pattern selected for placement
@@ -17,12 +27,33 @@ class Game:
 
         self.phase = constants.SETUP_PHASE
         self.turn = 0
-        self.max_turns = constants.NUM_TURNS
+        self.max_turns = level["num_turns"]
         self.blocks_placed = 0 # Tracks individual blocks placed, maybe less relevant with patterns
-        self.max_blocks = 50 # Increased limit, maybe tie to pattern cost later?
+        self.placements = [] # (top_left_x, top_left_y, pattern) per successful placement, for batch tools
+        self.max_blocks = level["max_blocks"] # Maybe tie to pattern cost later?
+        self.outcome = None # constants.OUTCOME_* once the simulation ends
         self.outcome_message = ""
+        self.metrics_history = [] # TurnMetrics per simulated turn
+        self.metrics_listeners = [] # Callables receiving each TurnMetrics (HUD, batch runners, ...)
+        # --- Outcome Memoization ---
+        self.outcome_cache = OutcomeCache(disk_dir=constants.OUTCOME_CACHE_DIR) # Shared across resets
+        self._cache_key = None # Setup hash of the running simulation
+        self._recorded_run = None # Per-turn [births, deaths, persisted] while simulating a cache miss
+        self._replay_frames = None # Stored run being replayed on a cache hit
+        self._replay_entry = None
         self._setup_level()
 
+    def add_metrics_listener(self, listener):
+        """Registers a callable that is passed a TurnMetrics after every simulated turn."""
+        self.metrics_listeners.append(listener)
+
+    def _publish_metrics(self):
+        metrics = self.grid.stats.snapshot(self.turn)
+        self.metrics_history.append(metrics)
+        for listener in self.metrics_listeners:
+            listener(metrics)
+        return metrics
+
     def reset_level(self):
         self.grid = Grid(constants.GRID_WIDTH, constants.GRID_HEIGHT)
         self.craft_box = CraftBox() # Also reset craft box state potentially?
@@ -32,19 +63,25 @@ class Game:
         self.phase = constants.SETUP_PHASE
         self.turn = 0
         self.blocks_placed = 0
+        self.placements = []
+        self.outcome = None
         self.outcome_message = ""
+        self.metrics_history = []
+        self._cache_key = None
+        self._recorded_run = None
+        self._replay_frames = None
+        self._replay_entry = None
         self._setup_level()
         print("Level Reset.")
 
     def _setup_level(self):
-        # Example level setup: Only barriers now, start/goal are zones
-        barriers = [
-            [7, 5], [8, 5], [9, 5],
-            [7, 6], [8, 6], [9, 6],
-            [constants.GOAL_COLUMN - 2, 10], # Example barrier near goal
-        ]
+        # Level setup: Only barriers now, start/goal are zones
+        barriers = levels.get_level(self.level_id)["barriers"]
         for bx, by in barriers:
             self.grid.set_tile_type(bx, by, "barrier")
+        self.reachability = ReachabilityBound.from_grid(self.grid) # Barriers are fixed from here on
+        if constants.GRID_RENDER_MODE == "pixel_array":
+            self.grid_renderer = PixelGridRenderer(self.grid) # Static colors/grid lines for this level
 
     def _rotate_point(self, point, degrees, max_dx, max_dy):
         """Rotates a single relative point (dx, dy) clockwise."""
@@ -131,19 +168,21 @@ class Game:
                             pattern_cost = len(pattern_to_place)
 
                             # Check block limit
-                            if self.blocks_placed + pattern_cost <= self.max_blocks:
+                            if not block_budget_error(self.blocks_placed, pattern_cost, self.max_blocks):
                                 if self.grid.place_pattern(grid_x, grid_y, pattern_to_place):
                                     print("Pattern placed successfully!")
                                     self.blocks_placed += pattern_cost
+                                    self.placements.append((grid_x, grid_y, pattern_to_place))
                                     self.selected_pattern_index = None # Deselect after placement
                                     self.selected_pattern_rotation = 0 # Reset rotation
                                 else:
                                     print("Pattern placement failed (invalid location/overlap).")
                         else:
                             # If NO pattern is selected, place single block
-                            if self.blocks_placed < self.max_blocks:
+                            if not block_budget_error(self.blocks_placed, 1, self.max_blocks):
                                 if self.grid.place_live_cell(grid_x, grid_y):
                                     self.blocks_placed += 1
+                                    self.placements.append((grid_x, grid_y, [(0, 0)]))
                                 else: print("Cannot place block here.")
                             else: print(f"Block limit ({self.max_blocks}) reached.")
 
@@ -172,6 +211,7 @@ class Game:
             pattern = self.craft_box.get_pattern()
             if pattern: # Only save non-empty patterns
                 self.saved_patterns.append(pattern)
+                self.saved_pattern_keys.append(self.pattern_catalog.request(pattern)) # Classify in background
                 print(f"Pattern saved ({len(pattern)} cells). Total patterns: {len(self.saved_patterns)}")
             else:
                 print("Cannot save empty pattern.")
@@ -214,7 +254,7 @@ class Game:
 
         # Check Saved Pattern Selection Buttons (Select/Deselect)
         pattern_btn_y_start = craft_button_rect.bottom + 10
-        pattern_btn_height = 30
+        pattern_btn_height = 40 # Two lines: name and classification
         pattern_btn_width = 150
         for i, pattern in enumerate(self.saved_patterns):
             pattern_btn_rect = pygame.Rect(button_x, pattern_btn_y_start + i * (pattern_btn_height + 5), pattern_btn_width, pattern_btn_height)
@@ -232,39 +272,112 @@ class Game:
 
         return False
 
+    def is_animating(self):
+        """True while the scene changes every frame without any input (simulation running)."""
+        return self.phase == constants.SIMULATION_PHASE
+
+    def is_preview_active(self):
+        """True if the pattern preview follows the mouse, so mouse motion needs a redraw."""
+        return self.phase == constants.SETUP_PHASE and self.selected_pattern_index is not None
+
     def update(self):
         if self.phase == constants.SIMULATION_PHASE:
+            if self._replay_frames is not None:
+                self._replay_step() # Cache hit: no engine stepping
+                return
+
             if self.turn < self.max_turns:
-                live_cell_exists, state_changed = self._step_simulation()
+                state_changed = self._step_simulation()
                 self.turn += 1
+                metrics = self._publish_metrics()
+                live_cell_exists = metrics.population > 0
 
-                # Check for win condition (set within _step_simulation)
-                # The win flag (`self.outcome_message`) is set when a cell becomes persistent in the goal zone
+                # Check for win condition: a live cell in the goal zone (it becomes persistent there)
+                if metrics.goal_zone_live > 0 and not self.outcome_message:
+                    self._end_simulation(constants.OUTCOME_WIN)
 
                 # --- Check for Loss Conditions (Order matters) ---
                 # 1. No live cells left?
-                if not live_cell_exists and not self.outcome_message:
+                elif not live_cell_exists and not self.outcome_message:
                     print(f"Simulation stopped early at turn {self.turn}. All cells died.")
-                    self.outcome_message = "Game Over - All Cells Died!"
-                    self.phase = constants.GAME_OVER_PHASE
+                    self._end_simulation(constants.OUTCOME_DIED)
                 # 2. Grid became static (stalemate) and not already won?
                 elif not state_changed and not self.outcome_message:
                     print(f"Simulation stopped early at turn {self.turn}. Stalemate reached.")
-                    self.outcome_message = "Game Over - Stalemate!"
-                    self.phase = constants.GAME_OVER_PHASE
+                    self._end_simulation(constants.OUTCOME_STALEMATE)
+                # 3. No live cell can reach the goal column in the turns left?
+                elif self.turn < self.max_turns and not self.outcome_message and not self.is_goal_reachable():
+                    print(f"Simulation stopped early at turn {self.turn}. Goal unreachable.")
+                    self._end_simulation(constants.OUTCOME_UNREACHABLE)
 
             else:
                  # Max turns reached, check final win condition if not already won
                  if not self.outcome_message:
                      won_at_end = self._check_final_win_condition()
                      if won_at_end:
-                         self.outcome_message = "You Win!"
                          print(f"Win condition met at end of simulation.")
+                         self._end_simulation(constants.OUTCOME_WIN)
                      else:
-                        self.outcome_message = "Game Over - Max Turns Reached!"
                         print(f"Simulation finished after {self.max_turns} turns. No win.")
+                        self._end_simulation(constants.OUTCOME_MAX_TURNS)
                  self.phase = constants.GAME_OVER_PHASE
 
+    def is_goal_reachable(self):
+        """Conservative light-cone check: False only if no live cell can reach the goal in time."""
+        return self.reachability.can_reach_goal(self.grid.stats, self.max_turns - self.turn)
+
+    def _end_simulation(self, outcome, store=True):
+        """Sets the final outcome, ends the simulation and memoizes the result for this setup."""
+        self.outcome = outcome
+        self.outcome_message = constants.OUTCOME_MESSAGES[outcome]
+        self.phase = constants.GAME_OVER_PHASE
+        if store and self._cache_key is not None:
+            self.outcome_cache.put(self._cache_key, {
+                "outcome": outcome,
+                "turn": self.turn,
+                "run": self._recorded_run,
+            })
+        self._recorded_run = None
+
+    def _apply_run_frame(self, frame):
+        """Applies one recorded turn ([births, deaths, persisted]) to the grid."""
+        births, deaths, persisted = frame
+        for x, y in births:
+            self.grid.set_live(x, y, True)
+        for x, y in deaths:
+            self.grid.set_live(x, y, False)
+        for x, y in persisted:
+            self.grid.tiles[x][y].is_persistent = True
+            self.grid.record_persistent(x, y)
+
+    def _replay_step(self):
+        """Advances a cached run by one turn, ending with the cached outcome."""
+        if self._replay_frames:
+            self._apply_run_frame(self._replay_frames.popleft())
+            self.turn += 1
+            self._publish_metrics()
+        if not self._replay_frames:
+            entry = self._replay_entry
+            self._replay_frames = None
+            self._replay_entry = None
+            self.turn = entry["turn"]
+            print(f"Replayed cached run: {entry['outcome']} at turn {self.turn}.")
+            self._end_simulation(entry["outcome"], store=False)
+
+    def _start_from_cache(self, entry):
+        """Cache hit: replay the stored run, or jump straight to the result."""
+        run = entry.get("run")
+        if run is not None and constants.OUTCOME_CACHE_REPLAY:
+            self._replay_frames = deque(run)
+            self._replay_entry = entry
+            return
+        for frame in run or []:
+            self._apply_run_frame(frame) # Show the final board without stepping the engine
+        self.turn = entry["turn"]
+        self._publish_metrics()
+        print(f"Cached result: {entry['outcome']} at turn {self.turn}.")
+        self._end_simulation(entry["outcome"], store=False)
+
     def _spread_persistence(self, start_nodes):
         """Spreads the persistent state to adjacent live cells using BFS."""
         queue = deque(start_nodes)
@@ -283,14 +396,21 @@ class Game:
                     if neighbor_tile and (nx, ny) not in visited:
                         if neighbor_tile.is_live and not neighbor_tile.is_persistent:
                             neighbor_tile.is_persistent = True
+                            self.grid.record_persistent(nx, ny)
+                            if self._recorded_run is not None:
+                                self._recorded_run[-1][2].append((nx, ny))
                             visited.add((nx, ny))
                             queue.append((nx, ny))
 
     def _step_simulation(self):
-        """Processes one turn. Returns tuple: (live_cell_exists, state_changed)."""
+        """Processes one turn. Returns True if the state changed.
+           Population/zone counters in `self.grid.stats` and the grid's live/persistent masks
+           are updated as cells flip.
+        """
         next_grid_state = copy.deepcopy(self.grid.tiles)
+        grid = self.grid
         newly_persistent = []
-        live_cell_found_in_step = False
+        births, deaths = [], []
         state_changed_in_step = False # Track if any non-persistent cell changes state
 
         for x in range(constants.GRID_WIDTH):
@@ -302,8 +422,7 @@ class Game:
                     continue
 
                 if current_tile.is_persistent:
-                    next_tile_state.is_live = True # Ensure persistence overrides death
-                    live_cell_found_in_step = True
+                    next_tile_state.is_live = True # Ensure persistence overrides death (already live)
                     continue
 
                 live_neighbors = self.grid.get_live_neighbors(x, y)
@@ -323,40 +442,33 @@ class Game:
                 # --- Track state changes for non-persistent cells ---
                 if current_state != next_state:
                     state_changed_in_step = True
+                    grid.record_flip(x, y, next_state)
+                    (births if next_state else deaths).append((x, y))
 
                 if next_state:
-                    live_cell_found_in_step = True
-
                     # Check for Goal Zone entry & Mark for Persistence
                     if current_tile.is_goal:
                         if not next_tile_state.is_persistent:
                             next_tile_state.is_persistent = True
+                            grid.record_persistent(x, y)
                             newly_persistent.append((x, y))
-                            if not self.outcome_message:
-                                self.outcome_message = "You Win!"
-                                self.phase = constants.GAME_OVER_PHASE
                             print(f"Goal reached at ({x},{y}) on turn {self.turn + 1}! Win condition met.")
 
         self.grid.tiles = next_grid_state
+        if self._recorded_run is not None:
+            self._recorded_run.append([births, deaths, list(newly_persistent)]) # Spread appends to this frame
 
         if newly_persistent:
              self._spread_persistence(newly_persistent)
              # Persistence spread itself counts as a state change
              state_changed_in_step = True
-             # Ensure live_cell_found is true if persistence activated
-             if not live_cell_found_in_step:
-                 live_cell_found_in_step = True
 
         print(f"Turn {self.turn + 1} complete.")
-        return (live_cell_found_in_step, state_changed_in_step)
+        return state_changed_in_step
 
     def _check_final_win_condition(self):
         """Check win condition after simulation ends. Returns True if win."""
-        for y in range(constants.GRID_HEIGHT):
-            tile = self.grid.get_tile(constants.GOAL_COLUMN, y)
-            if tile and tile.is_live:
-                return True # Found a live cell, win
-        return False # No live cells found in goal column
+        return self.grid.stats.goal_zone_live > 0 # Any live cell in the goal column
 
     def start_simulation(self):
         if self.phase == constants.SETUP_PHASE:
@@ -366,8 +478,19 @@ class Game:
                 return
             if self.blocks_placed > 0 or any(len(p) > 0 for p in self.saved_patterns): # Check blocks_placed too
                 self.phase = constants.SIMULATION_PHASE
+                self.outcome = None
                 self.outcome_message = ""
                 print("Starting Simulation Phase...")
+
+                # Identical setup seen before? Skip the engine entirely.
+                live_cells = [(x, y) for x in range(self.grid.width) for y in range(self.grid.height)
+                              if self.grid.tiles[x][y].is_live]
+                self._cache_key = setup_key(levels.get_level(self.level_id), live_cells, self.max_turns)
+                entry = self.outcome_cache.get(self._cache_key)
+                if entry is not None:
+                    self._start_from_cache(entry)
+                else:
+                    self._recorded_run = [] if constants.OUTCOME_CACHE_STORE_RUNS else None
             else:
                 print("Place at least one block or save a pattern before starting.")
 
@@ -393,16 +516,23 @@ class Game:
         # --- Draw Main Game (Setup, Sim, Game Over) --- #
         grid_width_pixels = constants.GRID_WIDTH * constants.CELL_SIZE
         grid_height_pixels = constants.GRID_HEIGHT * constants.CELL_SIZE
-        grid_surface = pygame.Surface((grid_width_pixels, grid_height_pixels), pygame.SRCALPHA)
-        grid_surface.fill((0,0,0,0))
+        if constants.GRID_RENDER_MODE == "pixel_array":
+            # Whole board in one scaled blit; preview is blended into the cell buffer
+            preview_cells, preview_color = (), None
+            if self.phase == constants.SETUP_PHASE and self.selected_pattern_index is not None:
+                preview_cells, preview_color = self._pattern_preview(current_mouse_pos)
+            self.grid_renderer.draw(surface, self.grid, preview_cells, preview_color)
+        else:
+            grid_surface = pygame.Surface((grid_width_pixels, grid_height_pixels), pygame.SRCALPHA)
+            grid_surface.fill((0,0,0,0))
 
-        self.grid.draw(grid_surface)
+            self.grid.draw(grid_surface)
 
-        # Draw pattern preview if one is selected
-        if self.phase == constants.SETUP_PHASE and self.selected_pattern_index is not None:
-            self._draw_pattern_preview(grid_surface, current_mouse_pos)
+            # Draw pattern preview if one is selected
+            if self.phase == constants.SETUP_PHASE and self.selected_pattern_index is not None:
+                self._draw_pattern_preview(grid_surface, current_mouse_pos)
 
-        surface.blit(grid_surface, (0, 0))
+            surface.blit(grid_surface, (0, 0))
 
         # UI elements
         ui_y_start = grid_height_pixels + 10
@@ -417,7 +547,7 @@ class Game:
             if self.selected_pattern_index is not None:
                  phase_str += f" - Pattern {self.selected_pattern_index} Selected ({self.selected_pattern_rotation}°)"
         elif self.phase == constants.SIMULATION_PHASE:
-             phase_str = f"Simulation Turn: {self.turn}/{self.max_turns}"
+             phase_str = f"Simulation Turn: {self.turn}/{self.max_turns} - Live: {self.grid.stats.population}"
         elif self.phase == constants.GAME_OVER_PHASE:
             phase_str = "Simulation Over"
         text_surface = font.render(phase_str, True, constants.WHITE)
@@ -428,6 +558,12 @@ class Game:
         blocks_surface = font.render(blocks_text, True, constants.WHITE)
         surface.blit(blocks_surface, (10, ui_y_start + 30))
 
+        # Sandbox classification of the selected pattern
+        if self.phase == constants.SETUP_PHASE and self.selected_pattern_index is not None:
+            analysis_text = self._pattern_analysis_text(self.selected_pattern_index)
+            analysis_surface = font_small.render(analysis_text, True, constants.YELLOW)
+            surface.blit(analysis_surface, (10, ui_y_start + 60))
+
         # Button Area Calculations
         button_x = grid_width_pixels + 20
         button_y = 50
@@ -460,8 +596,9 @@ class Game:
                 surface.blit(craft_text, craft_text.get_rect(center=craft_button_rect.center))
 
                 pattern_btn_y_start = craft_button_rect.bottom + 10
-                pattern_btn_height = 30
+                pattern_btn_height = 40 # Two lines: name and classification
                 pattern_btn_width = 150
+                font_tiny = pygame.font.Font(None, 18)
                 for i, pattern in enumerate(self.saved_patterns):
                     pattern_btn_rect = pygame.Rect(button_x, pattern_btn_y_start + i * (pattern_btn_height + 5), pattern_btn_width, pattern_btn_height)
                     is_selected = (self.selected_pattern_index == i)
@@ -472,7 +609,10 @@ class Game:
                     if is_selected:
                         pattern_text_str += f" [{self.selected_pattern_rotation}°]"
                     pattern_text = font_small.render(pattern_text_str, True, constants.BLACK)
-                    surface.blit(pattern_text, pattern_text.get_rect(center=pattern_btn_rect.center))
+                    surface.blit(pattern_text, pattern_text.get_rect(centerx=pattern_btn_rect.centerx, top=pattern_btn_rect.top + 5))
+                    # Short sandbox classification under the name (full text in the HUD when selected)
+                    label_text = font_tiny.render(self._pattern_button_label(i), True, constants.BLACK)
+                    surface.blit(label_text, label_text.get_rect(centerx=pattern_btn_rect.centerx, bottom=pattern_btn_rect.bottom - 4))
 
         # --- Outcome Message --- #
         if self.phase == constants.GAME_OVER_PHASE and self.outcome_message:
@@ -484,11 +624,30 @@ class Game:
             retry_rect = retry_text_surface.get_rect(center=(constants.SCREEN_WIDTH // 2, result_rect.bottom + 20))
             surface.blit(retry_text_surface, retry_rect)
 
-    def _draw_pattern_preview(self, surface, current_mouse_pos):
-        """Draws preview of selected pattern (with rotation) based on current mouse pos."""
-        if self.selected_pattern_index is None:
-            return
-
+    def _pattern_analysis_text(self, index):
+        """Returns the classification label for a saved pattern (e.g. 'c/4 diagonal spaceship, period 4')."""
+        key, symmetry = self.saved_pattern_keys[index]
+        analysis = self.pattern_catalog.get(key)
+        if analysis is not None:
+            rotation = self.selected_pattern_rotation if index == self.selected_pattern_index else 0
+            return f"Pattern {index}: {analysis.describe(symmetry, rotation)}"
+        if self.pattern_catalog.is_pending(key):
+            return f"Pattern {index}: Analyzing..."
+        return f"Pattern {index}: Not analyzed"
+
+    def _pattern_button_label(self, index):
+        """Short classification for a saved-pattern button (e.g. 'c/4 toward goal')."""
+        key, symmetry = self.saved_pattern_keys[index]
+        analysis = self.pattern_catalog.get(key)
+        if analysis is not None:
+            rotation = self.selected_pattern_rotation if index == self.selected_pattern_index else 0
+            return analysis.short_label(symmetry, rotation)
+        return "Analyzing..." if self.pattern_catalog.is_pending(key) else ""
+
+    def _pattern_preview(self, current_mouse_pos):
+        """Returns (in-bounds preview cells, RGBA color) for the selected pattern (with rotation)
+           at the current mouse pos. The color shows whether placement would be valid.
+        """
         grid_x = current_mouse_pos[0] // constants.CELL_SIZE
         grid_y = current_mouse_pos[1] // constants.CELL_SIZE
 
@@ -502,28 +661,25 @@ class Game:
         preview_color_valid = (*constants.WHITE, 120) # Semi-transparent white
         preview_color_invalid = (*constants.RED, 100) # Semi-transparent red
 
-        # Check validity before drawing
-        is_placement_valid = True
-        pattern_cost = len(pattern_to_preview)
-        if self.blocks_placed + pattern_cost > self.max_blocks:
-             is_placement_valid = False # Check block limit as part of validity
-        else:
-             for dx, dy in pattern_to_preview:
-                 px = grid_x + dx
-                 py = grid_y + dy
-                 if not (0 <= px < constants.GRID_WIDTH and 0 <= py < constants.GRID_HEIGHT and px < constants.START_ZONE_WIDTH):
-                      is_placement_valid = False; break
-                 tile = self.grid.get_tile(px, py)
-                 if not tile or tile.tile_type != "empty" or tile.is_goal or tile.is_live:
-                     is_placement_valid = False; break
-
-        # Draw preview cells
-        final_preview_color = preview_color_valid if is_placement_valid else preview_color_invalid
-        for dx, dy in pattern_to_preview:
-            px = grid_x + dx
-            py = grid_y + dy
-            if 0 <= px < constants.GRID_WIDTH and 0 <= py < constants.GRID_HEIGHT:
-                rect = pygame.Rect(px * constants.CELL_SIZE, py * constants.CELL_SIZE, constants.CELL_SIZE, constants.CELL_SIZE)
-                preview_cell_surface = pygame.Surface(rect.size, pygame.SRCALPHA)
-                preview_cell_surface.fill(final_preview_color)
-                surface.blit(preview_cell_surface, rect.topleft) 
\ No newline at end of file
+        # Check validity before drawing (block limit + the same rules as Grid.place_pattern)
+        is_placement_valid = not (
+            block_budget_error(self.blocks_placed, len(pattern_to_preview), self.max_blocks)
+            or pattern_placement_error(grid_x, grid_y, pattern_to_preview, self.grid.tile_state,
+                                       self.grid.width, self.grid.height))
+
+        preview_cells = [(grid_x + dx, grid_y + dy) for dx, dy in pattern_to_preview
+                         if 0 <= grid_x + dx < constants.GRID_WIDTH and 0 <= grid_y + dy < constants.GRID_HEIGHT]
+        return preview_cells, (preview_color_valid if is_placement_valid else preview_color_invalid)
+
+    def _draw_pattern_preview(self, surface, current_mouse_pos):
+        """Draws preview of selected pattern (with rotation) based on current mouse pos."""
+        if self.selected_pattern_index is None:
+            return
+
+        preview_cells, preview_color = self._pattern_preview(current_mouse_pos)
+
+        # Draw preview cells (one shared translucent cell surface)
+        preview_cell_surface = pygame.Surface((constants.CELL_SIZE, constants.CELL_SIZE), pygame.SRCALPHA)
+        preview_cell_surface.fill(preview_color)
+        for px, py in preview_cells:
+            surface.blit(preview_cell_surface, (px * constants.CELL_SIZE, py * constants.CELL_SIZE))
@@ -1,5 +1,8 @@
+import numpy as np
 import pygame
 import constants
+from metrics import GridStats
+from placement import cell_placement_error, pattern_placement_error
 
 class Tile:
     def __init__(self, x, y, tile_type="empty", is_live=False, is_goal=False):
@@ -50,6 +53,10 @@ class Grid:
              for y in range(height)]
             for x in range(width)
         ]
+        self.stats = GridStats(width, height) # Kept in sync as cells flip
+        # Live/persistent state as bool arrays indexed [x, y], kept in sync for the pixel renderer
+        self.live_mask = np.zeros((width, height), dtype=bool)
+        self.persistent_mask = np.zeros((width, height), dtype=bool)
         # Remove specific start/end tile pos - handled by zones now
         # self.start_tile_pos = None
         # self.end_tile_pos = None
@@ -71,15 +78,35 @@ class Grid:
             return self.tiles[x][y]
         return None
 
+    def set_live(self, x, y, is_live):
+        """Sets a tile's live state, keeping the population/zone counters in sync."""
+        tile = self.tiles[x][y]
+        if tile.is_live != is_live:
+            tile.is_live = is_live
+            self.record_flip(x, y, is_live)
+
+    def record_flip(self, x, y, is_live):
+        """Call whenever the tile at (x, y) changes its live state (set_live does this)."""
+        self.stats.record_flip(x, y, is_live)
+        self.live_mask[x, y] = is_live
+
+    def record_persistent(self, x, y):
+        """Call when a live tile becomes persistent."""
+        self.stats.record_persistent(x, y)
+        self.persistent_mask[x, y] = True
+
+    def tile_state(self, x, y):
+        """(tile_type, is_live) of an in-bounds tile, as used by the placement rules."""
+        tile = self.tiles[x][y]
+        return tile.tile_type, tile.is_live
+
     def place_live_cell(self, x, y):
-        # --- Restrict placement to start zone and non-barrier tiles ---
-        if x < constants.START_ZONE_WIDTH:
-            tile = self.get_tile(x, y)
-            # Can only place on 'empty' tiles (not barriers or goal tiles)
-            if tile and tile.tile_type == "empty" and not tile.is_goal:
-                tile.is_live = True
-                return True
-        return False
+        # --- Same rules as place_pattern: start zone, empty (non-barrier) and not already live ---
+        tile_type, is_live = self.tile_state(x, y) if self.get_tile(x, y) else (None, False)
+        if cell_placement_error(x, y, tile_type, is_live, self.width, self.height):
+            return False
+        self.set_live(x, y, True)
+        return True
 
     def draw(self, surface):
         for x in range(self.width):
@@ -104,35 +131,15 @@ class Grid:
            Returns True if successful, False otherwise.
            Checks all cells for validity before placing any.
         """
-        placement_cells = []
-        # 1. Validate all target cells
+        # 1. Validate all target cells (shared rules, see placement.py)
+        error = pattern_placement_error(top_left_x, top_left_y, pattern, self.tile_state,
+                                        self.width, self.height)
+        if error:
+            print(f"Placement failed: {error}")
+            return False
+
+        # 2. All cells are valid, place the pattern
+        print(f"Placing pattern with {len(pattern)} cells...")
         for dx, dy in pattern:
-            target_x = top_left_x + dx
-            target_y = top_left_y + dy
-
-            # Check bounds
-            if not (0 <= target_x < self.width and 0 <= target_y < self.height):
-                print(f"Placement failed: Out of bounds at ({target_x}, {target_y})")
-                return False
-            # Check start zone
-            if not (target_x < constants.START_ZONE_WIDTH):
-                 print(f"Placement failed: Outside start zone at ({target_x}, {target_y})")
-                 return False
-            # Check tile validity (empty, not barrier, not goal)
-            tile = self.get_tile(target_x, target_y)
-            if not tile or tile.tile_type != "empty" or tile.is_goal or tile.is_live:
-                 print(f"Placement failed: Invalid tile at ({target_x}, {target_y}) - Type: {tile.tile_type if tile else 'None'}, Live: {tile.is_live if tile else 'N/A'}")
-                 return False
-
-            placement_cells.append((target_x, target_y))
-
-        # 2. If all cells are valid, place the pattern
-        if len(placement_cells) == len(pattern): # Ensure all pattern cells were validated
-             print(f"Placing pattern with {len(placement_cells)} cells...")
-             for x, y in placement_cells:
-                 self.tiles[x][y].is_live = True
-             return True
-        else:
-             # Should not happen if validation logic is correct, but as a safeguard
-             print("Placement failed: Validation mismatch.")
-             return False 
\ No newline at end of file
+            self.set_live(top_left_x + dx, top_left_y + dy, True)
+        return True
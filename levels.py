@@ -0,0 +1,22 @@
+import constants
+
+# Level definitions (barriers, block budget, turn limit), keyed by level id.
+# Shared by Game and by headless tools (ensemble, simulation service) so they agree on the rules.
+DEFAULT_LEVEL_ID = "default"
+
+LEVELS = {
+    "default": {
+        "barriers": [
+            [7, 5], [8, 5], [9, 5],
+            [7, 6], [8, 6], [9, 6],
+            [constants.GOAL_COLUMN - 2, 10], # Example barrier near goal
+        ],
+        "max_blocks": 50,
+        "num_turns": constants.NUM_TURNS,
+    },
+}
+
+
+def get_level(level_id):
+    """Returns the level definition for an id. Raises KeyError for unknown levels."""
+    return LEVELS[level_id]
@@ -2,6 +2,9 @@ import pygame
 import constants
 from game import Game
 
+# Window events that invalidate what is on screen; other events don't need a redraw
+REDRAW_EVENTS = (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED, pygame.WINDOWRESIZED, pygame.WINDOWFOCUSGAINED)
+
 def main():
     pygame.init()
     screen = pygame.display.set_mode((constants.SCREEN_WIDTH, constants.SCREEN_HEIGHT))
@@ -10,30 +13,55 @@ def main():
     game = Game()
 
     running = True
+    dirty = True # Scene needs a redraw
+    catalog_version = game.pattern_catalog.version
     while running:
-        for event in pygame.event.get():
+        # --- Collect events ---
+        if constants.RENDER_ON_DEMAND and not game.is_animating():
+            # Idle: block until input arrives (or timeout) instead of spinning
+            event = pygame.event.wait(constants.IDLE_WAIT_TIMEOUT_MS)
+            events = [event] + pygame.event.get() if event.type != pygame.NOEVENT else []
+        else:
+            events = pygame.event.get()
+
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
             # --- Pass relevant input events to the game object --- #
             elif event.type == pygame.MOUSEBUTTONDOWN:
                  game.handle_input(event)
+                 dirty = True
             elif event.type == pygame.KEYDOWN:
                  game.handle_input(event) # Let game handle ALL key presses
+                 dirty = True
+            elif event.type == pygame.MOUSEMOTION:
+                 if game.is_preview_active(): dirty = True # Preview follows the mouse
+            elif event.type in REDRAW_EVENTS:
+                 dirty = True # Window contents lost or changed size
 
+        # Background pattern analysis finished -> show the new classification
+        if game.pattern_catalog.version != catalog_version:
+            catalog_version = game.pattern_catalog.version
+            dirty = True
 
         # --- Update game logic based on phase ---
         # Update only runs during simulation phase
         if game.phase == constants.SIMULATION_PHASE:
              game.update() # Run one simulation step per frame
+             dirty = True
 
-        # Drawing (always happens)
-        screen.fill(constants.BLACK)
-        game.draw(screen)
-        pygame.display.flip()
-
-        clock.tick(100) # Target 100 frames per second (100 simulation steps/sec)
+        # Drawing (only when something changed, unless render-on-demand is off)
+        if dirty or not constants.RENDER_ON_DEMAND:
+            screen.fill(constants.BLACK)
+            game.draw(screen)
+            pygame.display.flip()
+            dirty = False
+            # Cap every redraw, not just the simulation: 100 frames per second (100 simulation
+            # steps/sec), and a pattern preview following the mouse can't redraw faster either
+            clock.tick(constants.SIMULATION_FPS)
 
+    game.pattern_catalog.shutdown()
     pygame.quit()
 
 if __name__ == '__main__':
-    main() 
\ No newline at end of file
+    main()
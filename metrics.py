@@ -0,0 +1,54 @@
+from collections import namedtuple
+import constants
+
+# Snapshot of the board statistics at the end of a turn
+TurnMetrics = namedtuple("TurnMetrics", [
+    "turn", "population", "persistent_count", "rightmost_live_column",
+    "start_zone_live", "goal_zone_live",
+])
+
+
+class GridStats:
+    """Population and zone counters, updated as cells flip instead of by rescanning the grid.
+       All queries are O(1) (rightmost column is amortized O(1) as the front retreats).
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.population = 0
+        self.persistent_count = 0
+        self.start_zone_live = 0
+        self.goal_zone_live = 0
+        self.column_counts = [0] * width
+        self._rightmost = -1 # Rightmost column with a live cell, -1 if none
+
+    def record_flip(self, x, y, is_live):
+        """Call whenever the tile at (x, y) changes its live state."""
+        delta = 1 if is_live else -1
+        self.population += delta
+        self.column_counts[x] += delta
+        if x < constants.START_ZONE_WIDTH:
+            self.start_zone_live += delta
+        if x == constants.GOAL_COLUMN:
+            self.goal_zone_live += delta
+
+        if is_live:
+            if x > self._rightmost:
+                self._rightmost = x
+        elif x == self._rightmost and self.column_counts[x] == 0:
+            # Front retreated: walk left to the next occupied column
+            while self._rightmost >= 0 and self.column_counts[self._rightmost] == 0:
+                self._rightmost -= 1
+
+    def record_persistent(self, x, y):
+        """Call when a live tile becomes persistent."""
+        self.persistent_count += 1
+
+    @property
+    def rightmost_live_column(self):
+        return self._rightmost
+
+    def snapshot(self, turn):
+        return TurnMetrics(turn, self.population, self.persistent_count, self._rightmost,
+                           self.start_zone_live, self.goal_zone_live)
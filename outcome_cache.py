@@ -0,0 +1,160 @@
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+import constants
+
+# Outcome memoization for identical setups (same level, same initial live cells).
+# Entries are dicts: {"outcome": OUTCOME_*, "turn": int, "run": [[births, deaths, persisted], ...] or None}.
+
+
+def _is_cell(cell):
+    return (isinstance(cell, list) and len(cell) == 2
+            and all(isinstance(v, int) and not isinstance(v, bool) for v in cell)
+            and 0 <= cell[0] < constants.GRID_WIDTH and 0 <= cell[1] < constants.GRID_HEIGHT)
+
+
+def is_valid_entry(entry):
+    """True if entry has the shape above. Disk files may be truncated, stale or foreign."""
+    if not isinstance(entry, dict) or entry.get("outcome") not in constants.OUTCOME_MESSAGES:
+        return False
+    turn = entry.get("turn")
+    if not isinstance(turn, int) or isinstance(turn, bool) or turn < 0:
+        return False
+    run = entry.get("run")
+    if run is None:
+        return True
+    return isinstance(run, list) and all(
+        isinstance(frame, list) and len(frame) == 3
+        and all(isinstance(cells, list) and all(_is_cell(cell) for cell in cells) for cells in frame)
+        for frame in run)
+
+
+def setup_key(level, cells, max_turns):
+    """Stable content hash of a level definition, turn limit and initial live-cell set."""
+    payload = json.dumps({
+        "barriers": sorted(map(list, level["barriers"])),
+        "rules": constants.RULES_VERSION,
+        "grid": [constants.GRID_WIDTH, constants.GRID_HEIGHT, constants.START_ZONE_WIDTH, constants.GOAL_COLUMN],
+        "max_turns": max_turns,
+        "cells": sorted(map(list, cells)),
+    }, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("ascii")).hexdigest()
+
+
+class OutcomeCache:
+    """In-memory LRU tier plus an optional on-disk tier (one JSON file per key).
+       The disk tier evicts least recently used files once it grows past max_disk_bytes.
+       Its file sizes are scanned once at startup and then tracked in memory, so files
+       written by other processes afterwards are only counted once this one reads them.
+    """
+
+    def __init__(self, max_entries=constants.OUTCOME_CACHE_SIZE, disk_dir=None,
+                 max_disk_bytes=constants.OUTCOME_CACHE_MAX_DISK_BYTES):
+        self.max_entries = max_entries
+        self.disk_dir = disk_dir
+        self.max_disk_bytes = max_disk_bytes
+        self._memory = OrderedDict() # key -> entry, oldest first
+        self._disk_files = OrderedDict() # key -> file size in bytes, least recently used first
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+            self._scan_disk()
+
+    def get(self, key):
+        """Returns the cached entry or None. Disk hits are promoted to memory."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry
+        entry = self._read_disk(key)
+        if entry is not None:
+            self._remember(key, entry)
+        return entry
+
+    def put(self, key, entry):
+        self._remember(key, entry)
+        self._write_disk(key, entry)
+
+    def __contains__(self, key):
+        return self.get(key) is not None
+
+    def _remember(self, key, entry):
+        with self._lock:
+            self._memory[key] = entry
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    # --- Disk tier ---
+    def _path(self, key):
+        return os.path.join(self.disk_dir, f"{key}.json")
+
+    def _scan_disk(self):
+        files = []
+        for name in os.listdir(self.disk_dir):
+            if not name.endswith(".json"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.disk_dir, name))
+            except OSError:
+                continue
+            files.append((stat.st_mtime, name[:-len(".json")], stat.st_size))
+        for _, key, size in sorted(files): # Least recently used first
+            self._disk_files[key] = size
+            self._disk_bytes += size
+        self._evict_disk()
+
+    def _track_disk(self, key, size):
+        """Records a file's (new) size as most recently used. Call with self._lock held."""
+        self._disk_bytes += size - self._disk_files.pop(key, 0)
+        self._disk_files[key] = size
+
+    def _read_disk(self, key):
+        if not self.disk_dir:
+            return None
+        path = self._path(key)
+        try:
+            with open(path, "r") as f:
+                entry = json.load(f)
+            size = os.path.getsize(path)
+            os.utime(path) # Mark as recently used for eviction (and for the next startup scan)
+        except (OSError, ValueError):
+            return None # Missing or corrupt file is just a miss
+        if not is_valid_entry(entry):
+            return None # Truncated or foreign data is a miss too; the next put overwrites it
+        with self._lock:
+            self._track_disk(key, size)
+        return entry
+
+    def _write_disk(self, key, entry):
+        if not self.disk_dir:
+            return
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(entry, f, separators=(",", ":"))
+            size = os.path.getsize(tmp_path)
+            os.replace(tmp_path, path) # Atomic, readers never see half a file
+        except OSError as e:
+            print(f"Outcome cache: could not write {path}: {e}")
+            return
+        with self._lock:
+            self._track_disk(key, size)
+            self._evict_disk()
+
+    def _evict_disk(self):
+        """Removes least recently used files until the tracked total fits. Call with self._lock held
+           (or during __init__).
+        """
+        while self._disk_bytes > self.max_disk_bytes and self._disk_files:
+            key, size = self._disk_files.popitem(last=False)
+            self._disk_bytes -= size
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass # Already gone (e.g. removed by another process)
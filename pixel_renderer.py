@@ -0,0 +1,77 @@
+import numpy as np
+import pygame
+import constants
+
+START_ZONE_TINT = (20, 50, 20) # Same dark green hint as Tile.draw
+
+
+class PixelGridRenderer:
+    """Draws the whole grid with one scaled blit instead of per-tile draw calls.
+       Tile colors are written into a one-pixel-per-cell buffer (numpy, indexed [x, y] like
+       Grid.tiles), scaled up to CELL_SIZE, then covered by a precomputed overlay that only
+       leaves each tile's inner square visible (the live-cell inset of Tile.draw).
+    """
+
+    def __init__(self, grid, cell_size=constants.CELL_SIZE):
+        self.width = grid.width
+        self.height = grid.height
+        self.cell_size = cell_size
+        self.base_colors = self._build_base_colors(grid) # Static per level: zones and barriers
+        self.cell_surface = pygame.Surface((self.width, self.height)) # One pixel per cell
+        self.scaled_surface = pygame.Surface((self.width * cell_size, self.height * cell_size))
+        self.cell_overlay = self._build_cell_overlay(grid)
+        self.preview_surface = pygame.Surface((cell_size, cell_size), pygame.SRCALPHA)
+
+    def _build_base_colors(self, grid):
+        colors = np.empty((self.width, self.height, 3), dtype=np.uint8)
+        colors[:, :] = constants.DARK_GRAY
+        colors[:constants.START_ZONE_WIDTH, :] = START_ZONE_TINT
+        for x in range(self.width):
+            for y in range(self.height):
+                tile = grid.tiles[x][y]
+                if tile.is_goal:
+                    colors[x, y] = constants.BLUE
+                elif tile.tile_type == "barrier":
+                    colors[x, y] = constants.GRAY
+        return colors
+
+    def _build_cell_overlay(self, grid):
+        """Drawn once per level: each tile's base color outside the live-cell inset, then the
+           tile border (barriers have none), as in Tile.draw. The inset is left transparent.
+        """
+        overlay = pygame.Surface(self.scaled_surface.get_size(), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 0))
+        inset = self.cell_size // 4
+        for x in range(self.width):
+            for y in range(self.height):
+                rect = pygame.Rect(x * self.cell_size, y * self.cell_size, self.cell_size, self.cell_size)
+                overlay.fill(tuple(self.base_colors[x, y]), rect)
+                overlay.fill((0, 0, 0, 0), rect.inflate(-inset, -inset))
+                if grid.tiles[x][y].tile_type != "barrier":
+                    pygame.draw.rect(overlay, constants.LIGHT_GRAY, rect, 1)
+        return overlay
+
+    def render(self, live, persistent=None, preview_cells=(), preview_color=None):
+        """Renders from array state (no per-cell Python work). Returns the scaled grid surface.
+           preview_color is an RGBA tuple blended over preview_cells (borders included, as in
+           Game._draw_pattern_preview).
+        """
+        colors = self.base_colors.copy()
+        colors[live] = constants.WHITE
+        if persistent is not None:
+            colors[live & persistent] = constants.YELLOW
+
+        pygame.surfarray.blit_array(self.cell_surface, colors)
+        pygame.transform.scale(self.cell_surface, self.scaled_surface.get_size(), self.scaled_surface)
+        self.scaled_surface.blit(self.cell_overlay, (0, 0))
+
+        # Preview goes over the grid lines; only a handful of cells, so plain blits are fine
+        if preview_cells and preview_color is not None:
+            self.preview_surface.fill(preview_color)
+            for px, py in preview_cells:
+                self.scaled_surface.blit(self.preview_surface, (px * self.cell_size, py * self.cell_size))
+        return self.scaled_surface
+
+    def draw(self, surface, grid, preview_cells=(), preview_color=None, position=(0, 0)):
+        # Grid keeps its masks in sync as cells flip, so there is no per-tile scan here
+        surface.blit(self.render(grid.live_mask, grid.persistent_mask, preview_cells, preview_color), position)
@@ -0,0 +1,40 @@
+import constants
+
+# Placement rules shared by Grid (clicks), the placement preview and headless tools
+# (ensemble, simulation service), so they can't drift apart.
+
+
+def cell_placement_error(x, y, tile_type, is_live,
+                         width=constants.GRID_WIDTH, height=constants.GRID_HEIGHT):
+    """Returns why a live cell can't be placed at (x, y), or None if it can.
+       tile_type/is_live describe the target tile (ignored when out of bounds).
+    """
+    if not (0 <= x < width and 0 <= y < height):
+        return f"Out of bounds at ({x}, {y})"
+    # The goal column lies outside the start zone, so this also keeps goal tiles clear
+    if not x < constants.START_ZONE_WIDTH:
+        return f"Outside start zone at ({x}, {y})"
+    if tile_type != "empty" or is_live:
+        return f"Invalid tile at ({x}, {y}) - Type: {tile_type}, Live: {is_live}"
+    return None
+
+
+def pattern_placement_error(top_left_x, top_left_y, pattern, tile_state,
+                            width=constants.GRID_WIDTH, height=constants.GRID_HEIGHT):
+    """Checks every cell of a pattern (list of relative (dx, dy) coords) before placing any.
+       tile_state(x, y) returns (tile_type, is_live) for an in-bounds tile.
+       Returns the first error, or None if the whole pattern can be placed.
+    """
+    for dx, dy in pattern:
+        x, y = top_left_x + dx, top_left_y + dy
+        tile_type, is_live = tile_state(x, y) if (0 <= x < width and 0 <= y < height) else (None, False)
+        error = cell_placement_error(x, y, tile_type, is_live, width, height)
+        if error:
+            return error
+    return None
+
+
+def block_budget_error(blocks_placed, cost, max_blocks):
+    if blocks_placed + cost > max_blocks:
+        return f"Block limit ({max_blocks}) exceeded: {blocks_placed + cost} cells"
+    return None
@@ -0,0 +1,71 @@
+from collections import deque
+import constants
+
+# Light-cone bound: a live cell can only appear next to a cell that was live (or itself) the
+# turn before, and barrier tiles are never live. So a live cell needs at least as many turns
+# as its shortest 8-connected path through non-barrier tiles to reach the goal column.
+
+UNREACHABLE = float("inf")
+
+
+def goal_distance_field(barriers, width=constants.GRID_WIDTH, height=constants.GRID_HEIGHT):
+    """BFS from the goal column through non-barrier tiles. Returns distance[x][y] (king moves)."""
+    blocked = {(x, y) for x, y in map(tuple, barriers) if x != constants.GOAL_COLUMN}
+    distance = [[UNREACHABLE] * height for _ in range(width)]
+    queue = deque()
+    for y in range(height):
+        distance[constants.GOAL_COLUMN][y] = 0
+        queue.append((constants.GOAL_COLUMN, y))
+
+    while queue:
+        x, y = queue.popleft()
+        next_distance = distance[x][y] + 1
+        for i in range(-1, 2):
+            for j in range(-1, 2):
+                nx, ny = x + i, y + j
+                if (0 <= nx < width and 0 <= ny < height and (nx, ny) not in blocked
+                        and distance[nx][ny] > next_distance):
+                    distance[nx][ny] = next_distance
+                    queue.append((nx, ny))
+    return distance
+
+
+class ReachabilityBound:
+    """Conservative test for "the goal can no longer be reached in the remaining turns".
+       Never reports a reachable goal as unreachable.
+    """
+
+    def __init__(self, barriers, width=constants.GRID_WIDTH, height=constants.GRID_HEIGHT):
+        self.width = width
+        self.height = height
+        self.distance = goal_distance_field(barriers, width, height)
+        # Best case for any live cell in a column; lets us bound from per-column live counts
+        self.column_min_distance = [min(column) for column in self.distance]
+
+    @classmethod
+    def from_grid(cls, grid):
+        barriers = [(x, y) for x in range(grid.width) for y in range(grid.height)
+                    if grid.tiles[x][y].tile_type == "barrier"]
+        return cls(barriers, grid.width, grid.height)
+
+    def min_goal_distance(self, stats):
+        """Lower bound on turns until a live cell can reach the goal, from a GridStats."""
+        if stats.population == 0:
+            return UNREACHABLE
+        best = UNREACHABLE
+        for x in range(stats.rightmost_live_column, -1, -1):
+            if self.column_min_distance[x] >= best:
+                continue
+            if stats.column_counts[x]:
+                best = self.column_min_distance[x]
+        return best
+
+    def min_goal_distance_for_cells(self, cells):
+        """Exact shortest-path bound for an explicit set of live (x, y) cells (solver use)."""
+        return min((self.distance[x][y] for x, y in cells), default=UNREACHABLE)
+
+    def can_reach_goal(self, stats, remaining_turns):
+        # O(1) check from the rightmost live column first; barriers only make paths longer
+        if stats.population == 0 or constants.GOAL_COLUMN - stats.rightmost_live_column > remaining_turns:
+            return False
+        return self.min_goal_distance(stats) <= remaining_turns
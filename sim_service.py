@@ -0,0 +1,328 @@
+import argparse
+import json
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import constants
+import ensemble
+import levels
+from outcome_cache import OutcomeCache, setup_key
+
+# Local simulation service for leaderboard validation.
+# POST /validate with {"level": "default", "placements": [[x, y, [[dx, dy], ...]], ...]}
+# (or a list of such submissions) -> {"valid": true, "outcome": "win", "turn": 185, "cached": false}
+# GET /metrics -> request counts, cache hits, batch sizes, latency and throughput.
+
+
+class ServiceBusy(Exception):
+    """Raised when the pending-submission limit is reached."""
+
+
+class ServiceMetrics:
+    """Thread-safe counters plus a window of recent latencies."""
+
+    def __init__(self, latency_window=1000):
+        self._lock = threading.Lock()
+        self.started = time.monotonic()
+        self.requests = 0
+        self.completed = 0
+        self.invalid = 0
+        self.rejected = 0
+        self.cache_hits = 0
+        self.batches = 0
+        self.batched_submissions = 0
+        self._latencies = deque(maxlen=latency_window)
+
+    def count(self, name, amount=1):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + amount)
+
+    def record_batch(self, size):
+        with self._lock:
+            self.batches += 1
+            self.batched_submissions += size
+
+    def record_latency(self, seconds):
+        with self._lock:
+            self.completed += 1
+            self._latencies.append(seconds)
+
+    def snapshot(self, in_flight=0):
+        with self._lock:
+            latencies = sorted(self._latencies)
+            uptime = time.monotonic() - self.started
+
+            def percentile(fraction):
+                if not latencies:
+                    return 0.0
+                return round(latencies[min(len(latencies) - 1, int(fraction * len(latencies)))] * 1000, 3)
+
+            return {
+                "requests": self.requests,
+                "completed": self.completed,
+                "invalid": self.invalid,
+                "rejected": self.rejected,
+                "cache_hits": self.cache_hits,
+                "in_flight": in_flight,
+                "batches": self.batches,
+                "mean_batch_size": round(self.batched_submissions / self.batches, 2) if self.batches else 0.0,
+                "latency_ms": {"p50": percentile(0.5), "p95": percentile(0.95), "max": percentile(1.0)},
+                "throughput_per_s": round(self.completed / uptime, 2) if uptime > 0 else 0.0,
+                "uptime_s": round(uptime, 3),
+            }
+
+
+class SimulationService:
+    """Validates and simulates submitted setups without pygame.
+       Submissions are validated up front, answered from a content-addressed cache when possible,
+       and otherwise batched per level and simulated as one ensemble on a bounded worker pool.
+    """
+
+    def __init__(self, workers=constants.SERVICE_WORKERS, max_pending=constants.SERVICE_MAX_PENDING,
+                 batch_size=constants.SERVICE_BATCH_SIZE, batch_window_ms=constants.SERVICE_BATCH_WINDOW_MS,
+                 cache_size=constants.SERVICE_CACHE_SIZE):
+        self.batch_size = batch_size
+        self.batch_window = batch_window_ms / 1000
+        self.metrics = ServiceMetrics()
+        self._cache = OutcomeCache(max_entries=cache_size) # Content-addressed, memory tier only
+        self._in_flight = {} # setup key -> Future, so concurrent duplicates share one simulation
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._queue = queue.Queue()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="sim-worker")
+        self._dispatcher = threading.Thread(target=self._dispatch_loop, name="sim-dispatcher", daemon=True)
+        self._dispatcher.start()
+
+    def submit(self, level_id, placements):
+        """Returns a Future resolving to a result dict. Raises ServiceBusy if too many are pending."""
+        self.metrics.count("requests")
+        started = time.monotonic()
+        future = Future()
+
+        try:
+            level = levels.get_level(level_id)
+        except KeyError:
+            self.metrics.count("invalid")
+            future.set_result({"valid": False, "error": f"Unknown level '{level_id}'"})
+            return future
+        cells, error = ensemble.check_placements(placements, level["barriers"], level["max_blocks"])
+        if cells is None or not cells:
+            self.metrics.count("invalid")
+            future.set_result({"valid": False, "error": error or "No live cells placed"})
+            return future
+
+        key = setup_key(level, cells, level["num_turns"])
+        # Cache lookup, in-flight lookup and in-flight insert must be one critical section,
+        # otherwise two identical concurrent submissions can both miss and both be simulated
+        with self._lock:
+            cached = self._cache.get(key)
+            shared = self._in_flight.get(key) if cached is None else None
+            if cached is None and shared is None:
+                if not self._slots.acquire(blocking=False):
+                    self.metrics.count("rejected")
+                    raise ServiceBusy("Too many pending submissions")
+                self._in_flight[key] = future
+        if cached is not None:
+            self.metrics.count("cache_hits")
+            self.metrics.record_latency(time.monotonic() - started)
+            future.set_result(self._result(key, cached, cached=True))
+            return future
+        if shared is not None:
+            self.metrics.count("cache_hits") # Identical submission already being simulated
+            shared.add_done_callback(
+                lambda done: done.exception() or self.metrics.record_latency(time.monotonic() - started))
+            return shared
+
+        self._queue.put((key, level_id, cells, future, started))
+        return future
+
+    def validate(self, level_id, placements, timeout=constants.SERVICE_REQUEST_TIMEOUT_S):
+        """Blocking helper around submit()."""
+        return self.submit(level_id, placements).result(timeout)
+
+    def _dispatch_loop(self):
+        """Collects queued submissions into batches (up to batch_size or batch_window) per level."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.batch_window
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._queue.put(None) # Finish this batch, stop on the next loop
+                    break
+                batch.append(item)
+
+            by_level = {}
+            for item in batch:
+                by_level.setdefault(item[1], []).append(item)
+            for level_id, items in by_level.items():
+                self._pool.submit(self._run_batch, level_id, items)
+
+    def _run_batch(self, level_id, items):
+        try:
+            level = levels.get_level(level_id)
+            live_masks = ensemble.build_live_masks([cells for _, _, cells, _, _ in items])
+            outcomes, turns = ensemble.run_ensemble(live_masks, ensemble.build_barrier_mask(level["barriers"]),
+                                                    level["num_turns"])
+            self.metrics.record_batch(len(items))
+            for (key, _, _, future, started), outcome, turn in zip(items, outcomes, turns):
+                entry = {"outcome": outcome, "turn": turn, "run": None}
+                with self._lock: # Publish to the cache and retire the in-flight entry atomically
+                    self._cache.put(key, entry)
+                    self._in_flight.pop(key, None)
+                self.metrics.record_latency(time.monotonic() - started)
+                future.set_result(self._result(key, entry, cached=False))
+        except Exception as exc: # Never leave a client waiting on a crashed batch
+            for key, _, _, future, _ in items:
+                with self._lock:
+                    self._in_flight.pop(key, None)
+                if not future.done():
+                    future.set_exception(exc)
+        finally:
+            for _ in items:
+                self._slots.release()
+
+    @staticmethod
+    def _result(key, entry, cached):
+        return {"valid": True, "outcome": entry["outcome"], "turn": entry["turn"], "key": key, "cached": cached}
+
+    def metrics_snapshot(self):
+        with self._lock:
+            in_flight = len(self._in_flight)
+        return self.metrics.snapshot(in_flight)
+
+    def shutdown(self):
+        self._queue.put(None)
+        self._dispatcher.join()
+        self._pool.shutdown(wait=True)
+
+
+def _coordinate(value):
+    """Accepts only real ints. int() would silently turn 2.9, True or "1" into a different setup."""
+    if not isinstance(value, int) or isinstance(value, bool):
+        raise ValueError(f"Coordinate must be an integer: {value!r}")
+    return value
+
+
+def parse_submission(data):
+    """Turns a JSON submission into (level_id, placements). Raises ValueError if malformed."""
+    if not isinstance(data, dict):
+        raise ValueError("Submission must be an object")
+    level_id = data.get("level", levels.DEFAULT_LEVEL_ID)
+    if not isinstance(level_id, str):
+        raise ValueError(f"Level must be a string: {level_id!r}")
+    raw_placements = data.get("placements", [])
+    if not isinstance(raw_placements, list):
+        raise ValueError(f"Placements must be a list: {raw_placements!r}")
+    placements = []
+    for placement in raw_placements:
+        try:
+            x, y, pattern = placement
+            placements.append((_coordinate(x), _coordinate(y),
+                               [(_coordinate(dx), _coordinate(dy)) for dx, dy in pattern]))
+        except (TypeError, ValueError):
+            raise ValueError(f"Malformed placement: {placement!r}")
+    return level_id, placements
+
+
+class ServiceRequestHandler(BaseHTTPRequestHandler):
+    """JSON over HTTP front end for SimulationService (self.server.service)."""
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/metrics":
+            self._send_json(200, self.server.service.metrics_snapshot())
+        else:
+            self._send_json(404, {"error": "Not found"})
+
+    def do_POST(self):
+        if self.path != "/validate":
+            self._send_json(404, {"error": "Not found"})
+            return
+        # Check the declared size before reading: read(-1) blocks until the client closes,
+        # and a huge length would be buffered in memory
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+        except ValueError:
+            length = -1
+        if length < 0:
+            self._send_json(400, {"error": "Invalid Content-Length"})
+            return
+        if length > constants.SERVICE_MAX_BODY_BYTES:
+            self._send_json(413, {"error": f"Body larger than {constants.SERVICE_MAX_BODY_BYTES} bytes"})
+            return
+        try:
+            data = json.loads(self.rfile.read(length) or b"null")
+            submissions = data if isinstance(data, list) else [data]
+            parsed = [parse_submission(item) for item in submissions]
+        except ValueError as exc: # Includes JSONDecodeError
+            self._send_json(400, {"error": str(exc)})
+            return
+
+        service = self.server.service
+        try:
+            # Submit everything first so a list is simulated as one batch
+            futures = [service.submit(level_id, placements) for level_id, placements in parsed]
+            results = [future.result(constants.SERVICE_REQUEST_TIMEOUT_S) for future in futures]
+        except ServiceBusy as exc:
+            self._send_json(503, {"error": str(exc)})
+            return
+        except Exception as exc:
+            self._send_json(500, {"error": str(exc)})
+            return
+        self._send_json(200, results if isinstance(data, list) else results[0])
+
+    def log_message(self, format, *args):
+        pass # Keep the console quiet; use /metrics instead
+
+
+class ServiceHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = constants.SERVICE_MAX_PENDING # Default listen backlog (5) resets bursts of clients
+
+
+def make_server(host=constants.SERVICE_HOST, port=constants.SERVICE_PORT, service=None):
+    """Creates the HTTP server (port 0 picks a free port). Call serve_forever() to run it."""
+    server = ServiceHTTPServer((host, port), ServiceRequestHandler)
+    server.service = service or SimulationService()
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Life Labyrinth local simulation service")
+    parser.add_argument("--host", default=constants.SERVICE_HOST)
+    parser.add_argument("--port", type=int, default=constants.SERVICE_PORT)
+    parser.add_argument("--workers", type=int, default=constants.SERVICE_WORKERS)
+    args = parser.parse_args()
+
+    server = make_server(args.host, args.port, SimulationService(workers=args.workers))
+    print(f"Simulation service listening on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.service.shutdown()
+
+if __name__ == '__main__':
+    main()
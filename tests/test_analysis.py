@@ -0,0 +1,50 @@
+import os
+import sys
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import analysis
+from analysis import PatternCatalog
+
+LWSS = [(3, 0), (0, 0), (4, 1), (4, 2), (0, 2), (4, 3), (3, 3), (2, 3), (1, 3)] # Heads toward the goal (+x)
+BLINKER = [(0, 0), (1, 0), (2, 0)]
+
+
+class PatternCatalogTest(unittest.TestCase):
+
+    def setUp(self):
+        self.catalog = PatternCatalog()
+        self.addCleanup(self.catalog.shutdown)
+
+    def wait_for(self, key):
+        deadline = time.monotonic() + 30
+        while self.catalog.is_pending(key) and time.monotonic() < deadline:
+            time.sleep(0.01)
+        return self.catalog.get(key)
+
+    def analyzed(self, pattern):
+        key, symmetry = self.catalog.request(pattern)
+        return self.wait_for(key), symmetry
+
+    def test_short_labels(self):
+        analysis_result, symmetry = self.analyzed(LWSS)
+        self.assertEqual(analysis_result.short_label(symmetry), "c/2 toward goal")
+        self.assertEqual(analysis_result.short_label(symmetry, 180), "moves away from goal")
+        self.assertEqual(self.analyzed(BLINKER)[0].short_label(), "Oscillator p2")
+        self.assertEqual(self.analyzed([(0, 0)])[0].short_label(), "Dies out")
+
+    def test_failed_analysis_is_stored_as_unknown(self):
+        with mock.patch.object(analysis, "analyze_pattern", side_effect=RuntimeError("sandbox crashed")):
+            key, _ = self.catalog.request(BLINKER)
+            result = self.wait_for(key)
+
+        self.assertFalse(self.catalog.is_pending(key)) # The UI stops showing "Analyzing..."
+        self.assertEqual(result.kind, "unknown")
+        self.assertEqual(self.catalog.version, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import os
+import sys
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import constants
+import ensemble
+import levels
+from game import Game
+
+GOAL = constants.GOAL_COLUMN
+DEFAULT_BARRIERS = levels.get_level("default")["barriers"]
+BLINKER = [(0, 0), (1, 0), (2, 0)]
+
+
+def glider(x, y):
+    """Glider heading down-right (toward the goal)."""
+    return [(x + 1, y), (x + 2, y + 1), (x, y + 2), (x + 1, y + 2), (x + 2, y + 2)]
+
+
+def run_game(cells, max_turns):
+    game = Game()
+    game.max_turns = max_turns
+    for x, y in cells:
+        game.grid.set_live(x, y, True)
+    game.blocks_placed = len(cells) # Cells were set directly, bypassing the start-zone rule
+    game.start_simulation()
+    while game.phase == constants.SIMULATION_PHASE:
+        game.update()
+    return game.outcome, game.turn
+
+
+class EnsembleParityTest(unittest.TestCase):
+    """run_ensemble must give the same outcome and ending turn as Game.update on the default level."""
+
+    # Short runs (Game steps are slow) that still hit every outcome
+    MAX_TURNS = 12
+    CASES = {
+        "glider wins": glider(GOAL - 5, 20),
+        "single cell dies": [(GOAL - 3, 50)],
+        "block stalls": [(GOAL - 5, 60), (GOAL - 4, 60), (GOAL - 5, 61), (GOAL - 4, 61)],
+        "blinker far from goal is unreachable": [(60, 3), (61, 3), (62, 3)],
+        "blinker next to goal runs out of turns": [(GOAL - 2, 79), (GOAL - 2, 80), (GOAL - 2, 81)],
+        "glider hits the GOAL_COLUMN - 2 barrier": glider(GOAL - 6, 6),
+        "r-pentomino": [(GOAL - 12, 40), (GOAL - 11, 40), (GOAL - 13, 41), (GOAL - 12, 41), (GOAL - 12, 42)],
+    }
+
+    def test_matches_game(self):
+        names = list(self.CASES)
+        live_masks = ensemble.build_live_masks([self.CASES[name] for name in names])
+        outcomes, turns = ensemble.run_ensemble(live_masks, ensemble.build_barrier_mask(DEFAULT_BARRIERS),
+                                                self.MAX_TURNS)
+        for name, outcome, turn in zip(names, outcomes, turns):
+            with self.subTest(case=name):
+                self.assertEqual((outcome, turn), run_game(self.CASES[name], self.MAX_TURNS))
+        self.assertEqual(set(outcomes), {constants.OUTCOME_WIN, constants.OUTCOME_DIED, constants.OUTCOME_STALEMATE,
+                                         constants.OUTCOME_UNREACHABLE, constants.OUTCOME_MAX_TURNS})
+
+
+class ScoreSetupTest(unittest.TestCase):
+
+    def test_empty_setup_has_no_variants(self):
+        self.assertEqual(list(ensemble.generate_variants([], DEFAULT_BARRIERS)), [])
+        report = ensemble.score_setup([], DEFAULT_BARRIERS)
+        self.assertEqual((report.labels, report.base_outcome, report.robustness), ([], None, 0.0))
+
+    def test_variants_are_never_empty(self):
+        placements = [(1, 1, [(0, 0)]), (1, 30, BLINKER)]
+        labels = []
+        for label, cells in ensemble.generate_variants(placements, DEFAULT_BARRIERS):
+            self.assertTrue(cells, label)
+            labels.append(label)
+        self.assertEqual(labels[0], "base")
+        self.assertIn("placement 0: shift (1, 0)", labels)
+        self.assertIn("setup: shift (0, 1)", labels)
+
+    def test_invalid_setup_has_no_variants(self):
+        self.assertEqual(list(ensemble.generate_variants([(GOAL, 0, BLINKER)], DEFAULT_BARRIERS)), [])
+        self.assertEqual(list(ensemble.generate_variants([(1, 1, BLINKER)], DEFAULT_BARRIERS, max_blocks=2)), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import constants
+import outcome_cache
+from outcome_cache import OutcomeCache
+
+ENTRY = {"outcome": constants.OUTCOME_WIN, "turn": 12, "run": [[[[1, 2]], [], []], [[], [[1, 2]], []]]}
+
+
+class OutcomeCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.disk_dir = self.tmp.name
+
+    def write_raw(self, key, text):
+        with open(os.path.join(self.disk_dir, f"{key}.json"), "w") as f:
+            f.write(text)
+
+    def test_disk_round_trip(self):
+        OutcomeCache(disk_dir=self.disk_dir).put("k", ENTRY)
+        self.assertEqual(OutcomeCache(disk_dir=self.disk_dir).get("k"), ENTRY) # Fresh memory tier
+
+    def test_bad_disk_entries_are_misses(self):
+        bad = {
+            "truncated": '{"outcome": "win", "tu',
+            "list": "[1, 2]",
+            "no_turn": '{"outcome": "win"}',
+            "unknown_outcome": '{"outcome": "lost", "turn": 3}',
+            "string_turn": '{"outcome": "win", "turn": "3"}',
+            "bool_turn": '{"outcome": "win", "turn": true}',
+            "bad_frame": '{"outcome": "win", "turn": 3, "run": [[[1, 2]]]}',
+            "off_grid_cell": json.dumps({"outcome": "win", "turn": 3, "run": [[[[constants.GRID_WIDTH, 0]], [], []]]}),
+        }
+        for key, text in bad.items():
+            self.write_raw(key, text)
+        cache = OutcomeCache(disk_dir=self.disk_dir)
+        for key in bad:
+            with self.subTest(key=key):
+                self.assertIsNone(cache.get(key))
+                self.assertNotIn(key, cache)
+
+        self.write_raw("no_run", '{"outcome": "died", "turn": 4, "run": null}')
+        self.assertEqual(cache.get("no_run"), {"outcome": constants.OUTCOME_DIED, "turn": 4, "run": None})
+
+    def test_disk_tier_evicts_least_recently_used(self):
+        entry_size = len(json.dumps(ENTRY, separators=(",", ":")))
+        cache = OutcomeCache(max_entries=1, disk_dir=self.disk_dir, max_disk_bytes=3 * entry_size)
+        for key in ("a", "b", "c"):
+            cache.put(key, ENTRY)
+        cache.put("x", ENTRY) # Evicts "a" from memory so the next get reads the disk
+        self.assertIsNotNone(cache.get("b")) # Disk hit, now most recently used
+        cache.put("d", ENTRY)
+
+        on_disk = sorted(name[:-len(".json")] for name in os.listdir(self.disk_dir))
+        self.assertEqual(on_disk, ["b", "d", "x"])
+        self.assertLessEqual(sum(os.path.getsize(os.path.join(self.disk_dir, name))
+                                 for name in os.listdir(self.disk_dir)), 3 * entry_size)
+
+    def test_put_does_not_rescan_the_directory(self):
+        cache = OutcomeCache(disk_dir=self.disk_dir, max_disk_bytes=1024)
+        with mock.patch.object(outcome_cache.os, "listdir", side_effect=AssertionError("rescanned")):
+            for i in range(20):
+                cache.put(f"k{i}", ENTRY)
+        self.assertLessEqual(len(os.listdir(self.disk_dir)) * len(json.dumps(ENTRY, separators=(",", ":"))), 1024)
+
+
+if __name__ == '__main__':
+    unittest.main()
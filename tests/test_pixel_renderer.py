@@ -0,0 +1,54 @@
+import os
+import sys
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pygame
+import constants
+from grid import Grid
+from pixel_renderer import PixelGridRenderer
+
+
+class PixelRendererParityTest(unittest.TestCase):
+    """The pixel-array renderer must draw exactly what the per-tile Tile.draw path draws."""
+
+    def build_grid(self):
+        grid = Grid(constants.GRID_WIDTH, constants.GRID_HEIGHT)
+        for y in range(20, 40):
+            grid.set_tile_type(5, y, "barrier") # Inside the start zone
+            grid.set_tile_type(constants.GOAL_COLUMN - 2, y, "barrier")
+        for x, y in [(1, 1), (2, 1), (3, 1), (10, 50), (11, 51), (50, 0), (0, constants.GRID_HEIGHT - 1)]:
+            grid.set_live(x, y, True)
+        for y in (10, 11, 12): # Persistent cells in the goal column
+            grid.set_live(constants.GOAL_COLUMN, y, True)
+            grid.tiles[constants.GOAL_COLUMN][y].is_persistent = True
+            grid.record_persistent(constants.GOAL_COLUMN, y)
+        grid.set_live(constants.GOAL_COLUMN, 13, True) # Live but not persistent
+        return grid
+
+    def test_matches_tile_draw(self):
+        for cell_size in (6, 20):
+            with self.subTest(cell_size=cell_size):
+                original = constants.CELL_SIZE
+                constants.CELL_SIZE = cell_size # Tile rects and the live inset read it
+                try:
+                    grid = self.build_grid()
+                    size = (grid.width * cell_size, grid.height * cell_size)
+                    tiles_surface = pygame.Surface(size)
+                    grid.draw(tiles_surface)
+
+                    renderer = PixelGridRenderer(grid, cell_size)
+                    pixel_surface = renderer.render(grid.live_mask, grid.persistent_mask)
+                finally:
+                    constants.CELL_SIZE = original
+
+                expected = pygame.surfarray.array3d(tiles_surface)
+                actual = pygame.surfarray.array3d(pixel_surface)
+                differing = (expected != actual).any(axis=2).sum()
+                self.assertEqual(differing, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
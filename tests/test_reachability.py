@@ -0,0 +1,132 @@
+import os
+import random
+import sys
+import unittest
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import constants
+import ensemble
+import levels
+from game import Game
+from reachability import UNREACHABLE, ReachabilityBound
+
+GOAL = constants.GOAL_COLUMN
+DEFAULT_BARRIERS = [tuple(barrier) for barrier in levels.get_level("default")["barriers"]]
+
+
+def random_barriers(rng):
+    """The default level's barriers (including the one at GOAL_COLUMN - 2) plus wall segments near the goal."""
+    barriers = set(DEFAULT_BARRIERS)
+    for _ in range(rng.randrange(0, 6)):
+        x = rng.randrange(GOAL - 12, GOAL)
+        top = rng.randrange(0, constants.GRID_HEIGHT - 10)
+        barriers.update((x, y) for y in range(top, top + rng.randrange(3, 30)) if y < constants.GRID_HEIGHT)
+    return sorted(barriers)
+
+
+def random_cells(rng, barriers):
+    """A few random soups, mostly near the goal and the barriers, avoiding barrier tiles."""
+    blocked = set(barriers)
+    cells = set()
+    for _ in range(rng.randrange(1, 5)):
+        left = rng.randrange(GOAL - 30, GOAL - 6)
+        top = rng.randrange(0, constants.GRID_HEIGHT - 6)
+        for x in range(left, left + 6):
+            for y in range(top, top + 6):
+                if rng.random() < 0.4 and (x, y) not in blocked:
+                    cells.add((x, y))
+    return cells
+
+
+class UnprunedGame(Game):
+    """Reference game that never ends a run early as unreachable."""
+
+    def is_goal_reachable(self):
+        return True
+
+
+def run_game(game_class, cells, max_turns):
+    game = game_class()
+    game.max_turns = max_turns
+    for x, y in cells:
+        game.grid.set_live(x, y, True)
+    game.blocks_placed = len(cells) # Cells were set directly, bypassing the start-zone rule
+    game.start_simulation()
+    while game.phase == constants.SIMULATION_PHASE:
+        game.update()
+    return game.outcome, game.turn
+
+
+class ReachabilityBoundTest(unittest.TestCase):
+
+    def test_min_goal_distance_for_cells(self):
+        bound = ReachabilityBound(DEFAULT_BARRIERS)
+        self.assertEqual(bound.min_goal_distance_for_cells([]), UNREACHABLE)
+        self.assertEqual(bound.min_goal_distance_for_cells([(GOAL, 3)]), 0)
+        self.assertEqual(bound.min_goal_distance_for_cells([(GOAL - 1, 10)]), 1)
+        # A single barrier at GOAL_COLUMN - 2 doesn't lengthen the path (diagonal moves go around it)
+        self.assertEqual(bound.min_goal_distance_for_cells([(GOAL - 3, 10)]), 3)
+        self.assertEqual(bound.min_goal_distance_for_cells([(0, 0), (GOAL - 5, 50), (GOAL - 9, 1)]), 5)
+
+    def test_wall_with_gap(self):
+        # Wall in column GOAL_COLUMN - 2 with a single gap at y = 50
+        wall = [(GOAL - 2, y) for y in range(constants.GRID_HEIGHT) if y != 50]
+        bound = ReachabilityBound(wall)
+        self.assertEqual(bound.min_goal_distance_for_cells([(GOAL - 3, 10)]), 42) # 40 moves to the gap, 2 more
+        self.assertEqual(bound.min_goal_distance_for_cells([(GOAL - 2, 50)]), 2)
+        self.assertEqual(bound.min_goal_distance_for_cells([(GOAL - 3, 10), (GOAL - 3, 49)]), 3)
+
+        sealed = ReachabilityBound([(GOAL - 2, y) for y in range(constants.GRID_HEIGHT)])
+        self.assertEqual(sealed.min_goal_distance_for_cells([(GOAL - 3, 10)]), UNREACHABLE)
+        self.assertEqual(sealed.min_goal_distance_for_cells([(GOAL - 1, 10)]), 1)
+
+    def test_ensemble_pruning_has_no_false_losses(self):
+        rng = random.Random(32)
+        max_turns = 30
+        pruned_count = wins = 0
+        for _ in range(10): # 10 barrier layouts x 40 boards
+            barriers = random_barriers(rng)
+            boards = [random_cells(rng, barriers) for _ in range(40)]
+            live_masks = ensemble.build_live_masks(boards)
+            barrier_mask = ensemble.build_barrier_mask(barriers)
+            pruned = ensemble.run_ensemble(live_masks, barrier_mask, max_turns)
+            reference = ensemble.run_ensemble(live_masks, barrier_mask, max_turns, prune=False)
+
+            for (outcome, turn), (expected, expected_turn) in zip(zip(*pruned), zip(*reference)):
+                if expected == constants.OUTCOME_WIN:
+                    wins += 1
+                    self.assertEqual((outcome, turn), (expected, expected_turn))
+                elif outcome == constants.OUTCOME_UNREACHABLE:
+                    pruned_count += 1
+                    self.assertLessEqual(turn, expected_turn)
+                else:
+                    self.assertEqual((outcome, turn), (expected, expected_turn))
+        # The sample must exercise both sides of the bound
+        self.assertGreater(wins, 20)
+        self.assertGreater(pruned_count, 20)
+
+    def test_game_pruning_has_no_false_losses(self):
+        # Game steps are slow, so only two boards (one wins, one is pruned); the ensemble test covers breadth
+        rng = random.Random(29)
+        outcomes = set()
+        for _ in range(2):
+            cells = random_cells(rng, DEFAULT_BARRIERS)
+            pruned = run_game(Game, cells, max_turns=20)
+            reference = run_game(UnprunedGame, cells, max_turns=20)
+            outcomes.add(pruned[0])
+            if reference[0] == constants.OUTCOME_WIN or pruned[0] != constants.OUTCOME_UNREACHABLE:
+                self.assertEqual(pruned, reference)
+            else:
+                self.assertLessEqual(pruned[1], reference[1])
+        self.assertEqual(outcomes, {constants.OUTCOME_WIN, constants.OUTCOME_UNREACHABLE})
+
+    def test_game_prunes_a_run_that_cannot_reach_the_goal(self):
+        blinker = [(2, 2), (3, 2), (4, 2)] # Oscillates forever, far from the goal
+        self.assertEqual(run_game(Game, blinker, max_turns=5), (constants.OUTCOME_UNREACHABLE, 1))
+        self.assertEqual(run_game(UnprunedGame, blinker, max_turns=5), (constants.OUTCOME_MAX_TURNS, 5))
+
+
+if __name__ == '__main__':
+    unittest.main()
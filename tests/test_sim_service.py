@@ -0,0 +1,156 @@
+import http.client
+import json
+import os
+import sys
+import threading
+import unittest
+import urllib.error
+import urllib.request
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import constants
+import sim_service
+
+LWSS = [[3, 0], [0, 0], [4, 1], [4, 2], [0, 2], [4, 3], [3, 3], [2, 3], [1, 3]] # Heads toward the goal
+BLINKER = [[0, 0], [1, 0], [2, 0]]
+
+
+class SimulationServiceTest(unittest.TestCase):
+    """Runs the HTTP service on a free localhost port."""
+
+    def setUp(self):
+        # Long batch window so concurrent duplicates are guaranteed to overlap
+        service = sim_service.SimulationService(batch_window_ms=50)
+        self.server = sim_service.make_server(port=0, service=service)
+        self.port = self.server.server_address[1]
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.server.service.shutdown()
+
+    def post(self, payload):
+        """Returns (status, decoded JSON body)."""
+        body = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+        request = urllib.request.Request(f"http://127.0.0.1:{self.port}/validate", body,
+                                         {"Content-Type": "application/json"})
+        try:
+            with urllib.request.urlopen(request, timeout=30) as response:
+                return response.status, json.loads(response.read())
+        except urllib.error.HTTPError as error:
+            return error.code, json.loads(error.read())
+
+    def metrics(self):
+        with urllib.request.urlopen(f"http://127.0.0.1:{self.port}/metrics", timeout=30) as response:
+            return json.loads(response.read())
+
+    def test_valid_submission_then_cache_hit(self):
+        status, first = self.post({"level": "default", "placements": [[2, 40, LWSS]]})
+        self.assertEqual(status, 200)
+        self.assertEqual((first["outcome"], first["turn"], first["cached"]), (constants.OUTCOME_WIN, 185, False))
+
+        status, second = self.post({"level": "default", "placements": [[2, 40, LWSS]]})
+        self.assertEqual(status, 200)
+        self.assertTrue(second["cached"])
+        self.assertEqual((second["outcome"], second["turn"], second["key"]),
+                         (first["outcome"], first["turn"], first["key"]))
+
+    def test_rule_violations_are_invalid(self):
+        status, result = self.post({"placements": [[20, 40, LWSS]]})
+        self.assertEqual(status, 200)
+        self.assertFalse(result["valid"])
+        self.assertIn("start zone", result["error"])
+
+        status, result = self.post({"placements": [[0, 0, BLINKER], [0, 0, BLINKER]]})
+        self.assertFalse(result["valid"])
+
+        status, result = self.post({"level": "no-such-level", "placements": [[0, 0, BLINKER]]})
+        self.assertFalse(result["valid"])
+
+    def test_malformed_submissions_return_400(self):
+        for payload in (
+            b"not json",
+            {"placements": 5},
+            {"level": [1], "placements": [[0, 0, BLINKER]]},
+            {"placements": [[2, 40, "x"]]},
+            {"placements": [[2, 40]]},
+            {"placements": [[2.9, 40.7, LWSS]]}, # No silent rounding to a different setup
+            {"placements": [[2, True, LWSS]]},
+            {"placements": [[2, 40, [[0, 0], ["1", 0]]]]},
+            [1, 2],
+        ):
+            with self.subTest(payload=payload):
+                status, result = self.post(payload)
+                self.assertEqual(status, 400)
+                self.assertIn("error", result)
+
+    def post_with_length(self, content_length, body=b""):
+        """Sends a raw POST with an arbitrary Content-Length header. Returns (status, decoded JSON body)."""
+        connection = http.client.HTTPConnection("127.0.0.1", self.port, timeout=5)
+        try:
+            connection.putrequest("POST", "/validate")
+            connection.putheader("Content-Length", content_length)
+            connection.endheaders(body)
+            response = connection.getresponse()
+            return response.status, json.loads(response.read())
+        finally:
+            connection.close()
+
+    def test_bad_content_length_is_rejected_without_reading(self):
+        self.assertEqual(self.post_with_length("-1")[0], 400)
+        self.assertEqual(self.post_with_length("abc")[0], 400)
+        self.assertEqual(self.post_with_length(str(constants.SERVICE_MAX_BODY_BYTES + 1))[0], 413)
+
+    def test_concurrent_duplicates_are_simulated_once(self):
+        results = []
+        lock = threading.Lock()
+
+        def submit():
+            outcome = self.post({"placements": [[2, 40, LWSS]]})
+            with lock:
+                results.append(outcome)
+
+        threads = [threading.Thread(target=submit) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([status for status, _ in results], [200] * 16)
+        self.assertEqual(len({result["key"] for _, result in results}), 1)
+        metrics = self.metrics()
+        self.assertEqual(metrics["requests"], 16)
+        self.assertEqual(metrics["completed"], 16)
+        self.assertEqual(metrics["batches"], 1) # Duplicates coalesced into one simulation
+        self.assertEqual(metrics["in_flight"], 0)
+
+    def test_concurrent_distinct_submissions_are_batched(self):
+        payloads = [{"placements": [[1, y, BLINKER]]} for y in range(0, 96, 3)]
+        results = [None] * len(payloads)
+
+        def submit(index):
+            results[index] = self.post(payloads[index])
+
+        threads = [threading.Thread(target=submit, args=(i,)) for i in range(len(payloads))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertTrue(all(status == 200 and result["valid"] for status, result in results))
+        metrics = self.metrics()
+        self.assertEqual(metrics["completed"], len(payloads))
+        self.assertLess(metrics["batches"], len(payloads)) # At least some submissions shared a batch
+
+    def test_batch_request_returns_list(self):
+        status, results = self.post([{"placements": [[1, 10, BLINKER]]}, {"placements": [[1, 20, BLINKER]]}])
+        self.assertEqual(status, 200)
+        self.assertEqual(len(results), 2)
+        self.assertTrue(all(result["valid"] for result in results))
+
+
+if __name__ == '__main__':
+    unittest.main()